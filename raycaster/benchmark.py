@@ -0,0 +1,138 @@
+import argparse
+import functools
+import json
+import os
+import random
+import statistics
+import time
+from typing import Callable
+
+import pygame
+
+from raycaster.core import Drawable, Settings, SimulationClock, Updatable
+from raycaster.game import Game, InputReplay
+
+# Keys pressed along the benchmark route, as (number of frames, pressed keys)
+ROUTE = (
+    (60, ()),
+    (90, (pygame.K_RIGHT,)),
+    (120, (pygame.K_w,)),
+    (60, (pygame.K_w, pygame.K_LEFT)),
+    (90, (pygame.K_a,)),
+    (120, (pygame.K_s, pygame.K_RIGHT)),
+    (60, (pygame.K_d,)),
+)
+
+
+def enable_headless():
+    """
+    Makes SDL use the dummy video and audio drivers, must be called before pygame.init.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+def _timed(function: Callable, samples: list[float]) -> Callable:
+    """
+    Wraps the function to record the duration of every call in milliseconds.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        samples.append((time.perf_counter() - start) * 1000)
+        return result
+
+    return wrapper
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    """
+    Calculates the statistics of the recorded timings.
+    """
+    ordered = sorted(samples)
+    return {
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+def run(seed: int = 0) -> dict:
+    """
+    Replays the benchmark route in a headless game and measures every frame.
+
+    :param seed: seed of the random number generator used by the enemies
+    :return: Report with the settings, per-frame timings and their statistics
+    """
+    enable_headless()
+    random.seed(seed)
+
+    settings = Settings()
+    clock = SimulationClock(round(1000 / settings.FPS))
+    clock.install()
+    game = Game(clock)
+    replay = InputReplay(list(ROUTE))
+    game.player.get_pressed_keys = replay
+
+    timings = {
+        "Raycaster.update": [],
+        "WorldRenderer.draw": [],
+        "GuiRenderer.draw_hud": [],
+        "frame": [],
+    }
+    game.raycaster.update = _timed(game.raycaster.update, timings["Raycaster.update"])
+    game.renderer.draw = _timed(game.renderer.draw, timings["WorldRenderer.draw"])
+    game.gui_renderer.draw_hud = _timed(
+        game.gui_renderer.draw_hud, timings["GuiRenderer.draw_hud"]
+    )
+
+    while not replay.finished:
+        start = time.perf_counter()
+        replay.advance()
+        clock.tick()
+        Updatable.update_all()
+        Drawable.draw_all()
+        game.gui_renderer.draw_hud()
+        timings["frame"].append((time.perf_counter() - start) * 1000)
+
+    clock.uninstall()
+    return {
+        "settings": {
+            "resolution": [settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT],
+            "render_scale": settings.RENDER_SCALE,
+            "ray_count": settings.RAY_COUNT,
+            "max_distance": settings.MAX_DISTANCE,
+            "seed": seed,
+        },
+        "frames": replay.frame_count,
+        "summary": {name: _summarize(samples) for name, samples in timings.items()},
+        "sprite_cache": game.renderer.object_renderer.sprite_cache.stats,
+        "timings": timings,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a fixed route headlessly and report frame timings."
+    )
+    parser.add_argument("--output", help="path of the JSON report with all timings")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    report = run(args.seed)
+    print(f"{report['frames']} frames, {report['settings']['ray_count']} rays")
+    print(f"sprite cache hit rate {report['sprite_cache']['hit_rate']:.1%}")
+    print(f"{'':<24}{'mean':>10}{'median':>10}{'p95':>10}{'max':>10}")
+    for name, summary in report["summary"].items():
+        values = "".join(f"{value:>10.3f}" for value in summary.values())
+        print(f"{name:<24}{values}")
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
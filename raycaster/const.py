@@ -5,6 +5,9 @@ from raycaster.core import Settings
 
 # GAME RELATED
 RESOLUTION = Settings().SCREEN_WIDTH, Settings().SCREEN_HEIGHT
+RENDER_WIDTH = max(1, round(Settings().SCREEN_WIDTH * Settings().RENDER_SCALE))
+RENDER_HEIGHT = max(1, round(Settings().SCREEN_HEIGHT * Settings().RENDER_SCALE))
+RENDER_RESOLUTION = RENDER_WIDTH, RENDER_HEIGHT
 CAPTION = "Python Raycaster"
 
 # SOUND RELATED
@@ -23,9 +26,23 @@ class PlayerState(Enum):
 
 
 # MAP RELATED
-SCREEN_DISTANCE = (Settings().SCREEN_WIDTH // 2) / math.tan(
-    math.radians(Settings().FOV // 2)
-)
+SCREEN_DISTANCE = (RENDER_WIDTH // 2) / math.tan(math.radians(Settings().FOV // 2))
+COLUMN_WIDTH = RENDER_WIDTH / Settings().RAY_COUNT
+
+
+def refresh_projection_constants():
+    """
+    Recalculates the constants derived from the field of view, the ray count and the render scale.
+    """
+    global RENDER_WIDTH, RENDER_HEIGHT, RENDER_RESOLUTION
+    global DELTA_ANGLE, SCREEN_DISTANCE, COLUMN_WIDTH
+    settings = Settings()
+    RENDER_WIDTH = max(1, round(settings.SCREEN_WIDTH * settings.RENDER_SCALE))
+    RENDER_HEIGHT = max(1, round(settings.SCREEN_HEIGHT * settings.RENDER_SCALE))
+    RENDER_RESOLUTION = RENDER_WIDTH, RENDER_HEIGHT
+    DELTA_ANGLE = math.radians(settings.FOV / settings.RAY_COUNT)
+    SCREEN_DISTANCE = (RENDER_WIDTH // 2) / math.tan(math.radians(settings.FOV // 2))
+    COLUMN_WIDTH = RENDER_WIDTH / settings.RAY_COUNT
 
 
 # SPRITES RELATED
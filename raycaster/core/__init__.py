@@ -2,3 +2,4 @@ from raycaster.core.drawable import Drawable
 from raycaster.core.settings import Settings
 from raycaster.core.updatable import Updatable
 from raycaster.core.event import Event
+from raycaster.core.simulation_clock import SimulationClock
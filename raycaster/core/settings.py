@@ -5,6 +5,7 @@ class Settings:
     SCREEN_WIDTH = 1600
     SCREEN_HEIGHT = 900
     FPS = 60
+    IDLE_FPS = 10  # Frame rate of screens that do not change, like the start screen
 
     # SOUND RELATED
     MASTER_VOLUME = 0.8
@@ -22,6 +23,35 @@ class Settings:
     PLAYER_SENSITIVITY = 0.001
     PLAYER_HITBOX_RADIUS = CELL_SIZE // 8
 
+    # RAYCASTING RELATED
+    BATCH_RAYCASTING = True  # Cast all rays at once with NumPy
+    RAY_CACHE = True  # Reuse rays while the camera stands still or only rotates
+    RAY_CACHE_POSITION_STEP = 0.01
+    EMPTY_SPACE_SKIPPING = True  # Jump over empty cells near no walls
+    RAYCASTING_WORKERS = 0  # Cast tiles of columns in worker processes, 0 disables it
+    RAYCASTING_TILE_SIZE = 64
+
+    # QUALITY RELATED
+    ADAPTIVE_QUALITY = False  # Lower the ray count and render scale on slow frames
+    MIN_RAY_COUNT = 160
+    MAX_RAY_COUNT = RAY_COUNT
+    MIN_RENDER_SCALE = 0.5
+    MAX_RENDER_SCALE = 1.0
+    QUALITY_STEP = 0.1  # Relative change of the ray count or scale per adjustment
+    QUALITY_ADJUST_INTERVAL = 30  # Minimum number of frames between adjustments
+    FRAME_TIME_HIGH_RATIO = 0.9  # Lower the quality above this part of the frame budget
+    FRAME_TIME_LOW_RATIO = 0.6  # Raise the quality below this part of the frame budget
+
+    # RENDERING RELATED
+    SPRITE_CACHE_SIZE = 16 * 1024 * 1024  # Bytes of cached scaled sprites
+    SPRITE_SIZE_STEP = 2  # Sprite sizes are rounded down to multiples of this
+    SPRITE_ATLAS_HEIGHT = 4096  # Maximum height of a surface sprites are packed into
+    SHADE_LEVELS = 32  # Number of distinct distance shades
+    WALL_COMPOSITOR = False  # Draw the walls with NumPy instead of blitting columns
+    TEXTURED_FLOOR = False  # Draw textured floor and ceiling instead of the gradient
+    # Size of the rendered world relative to the screen, the HUD stays sharp
+    RENDER_SCALE = 1.0
+
     # MINIMAP RELATED
     MINIMAP_VISIBLE = True  # Press F4 to change
     MINIMAP_RATIO = 0.50
@@ -0,0 +1,58 @@
+import time
+
+
+class SimulationClock:
+    """
+    Replacement for pygame.time.Clock that advances the game time by a fixed step on every tick.
+
+    Once installed, it is also the time source of raycaster.utils.get_ticks, so animations,
+    cooldowns and movement no longer depend on how fast the frames are rendered.
+    """
+
+    active: "SimulationClock | None" = None
+
+    def __init__(self, frame_time: int):
+        self.frame_time = frame_time
+        self._ticks = 0
+        self._time = 0
+        self._rawtime = 0
+        self._last_tick = time.perf_counter()
+
+    def install(self):
+        """
+        Makes this clock the game's time source.
+        """
+        SimulationClock.active = self
+
+    def uninstall(self):
+        """
+        Restores the real time source.
+        """
+        if SimulationClock.active is self:
+            SimulationClock.active = None
+
+    def tick(self, framerate: float = 0) -> int:
+        """
+        Advances the game time by one frame without waiting.
+
+        :param framerate: ignored, kept for compatibility with pygame.time.Clock
+        :return: Simulated frame time in milliseconds
+        """
+        now = time.perf_counter()
+        self._rawtime = round((now - self._last_tick) * 1000)
+        self._last_tick = now
+        self._time = self.frame_time
+        self._ticks += self.frame_time
+        return self._time
+
+    def get_time(self) -> int:
+        return self._time
+
+    def get_rawtime(self) -> int:
+        return self._rawtime
+
+    def get_fps(self) -> float:
+        return 1000 / self.frame_time
+
+    def get_ticks(self) -> int:
+        return self._ticks
@@ -1,4 +1,7 @@
+from raycaster.game.texture_atlas import AtlasFrame, TextureAtlas
 from raycaster.game.asset_loader import AssetLoader
 from raycaster.game.map import Map
+from raycaster.game.input_replay import InputReplay
 from raycaster.game.player import Player
+from raycaster.game.quality_governor import QualityGovernor
 from raycaster.game.game import Game
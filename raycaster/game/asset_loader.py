@@ -1,7 +1,10 @@
 import os
+from typing import Hashable
+
 import pygame
 
 from raycaster.core import Settings
+from raycaster.game.texture_atlas import AtlasFrame, TextureAtlas
 from raycaster.const import (
     EnemyState,
     WeaponRepresentation,
@@ -18,6 +21,7 @@ class AssetLoader:
     ROOT_PATH: str
     ASSETS_PATH: str
     WALL_TEXTURES_PATH: str
+    FLOOR_TEXTURES_PATH: str
     OBJECTS_SPRITES_PATH: str
 
     def __new__(cls):
@@ -28,6 +32,7 @@ class AssetLoader:
             cls.ROOT_PATH = os.path.dirname(cls.GAME_PATH)
             cls.ASSETS_PATH = os.path.join(cls.ROOT_PATH, "assets")
             cls.WALL_TEXTURES_PATH = os.path.join(cls.ASSETS_PATH, "walls")
+            cls.FLOOR_TEXTURES_PATH = os.path.join(cls.ASSETS_PATH, "floors")
             cls.OBJECTS_SPRITES_PATH = os.path.join(cls.ASSETS_PATH, "objects")
             cls.STATIC_SPRITES_PATH = os.path.join(cls.OBJECTS_SPRITES_PATH, "static")
             cls.ANIMATED_SPRITES_PATH = os.path.join(
@@ -42,6 +47,9 @@ class AssetLoader:
             cls.PLAYER_PATH = os.path.join(cls.ASSETS_PATH, "player")
 
             cls._walls = cls._load_walls_textures()
+            cls._wall_columns = cls._split_wall_columns(cls._walls)
+            cls._floors = cls._load_floor_textures()
+            cls._sprite_atlas = TextureAtlas(Settings().SPRITE_ATLAS_HEIGHT)
             cls._static_objects = cls._load_static_sprites()
             cls._animated_objects = cls._load_animated_sprites()
             cls._enemies = cls._load_enemies()
@@ -57,21 +65,33 @@ class AssetLoader:
         return self._walls.copy()
 
     @property
-    def static_objects(self) -> dict[int, pygame.Surface]:
+    def wall_columns(self) -> dict[int, tuple[pygame.Surface, ...]]:
+        return self._wall_columns.copy()
+
+    @property
+    def floor_textures(self) -> dict[int, pygame.Surface]:
+        return self._floors.copy()
+
+    @property
+    def static_objects(self) -> dict[str, AtlasFrame]:
         return self._static_objects.copy()
 
     @property
-    def animated_objects(self) -> dict[int, list[pygame.Surface]]:
+    def animated_objects(self) -> dict[str, list[AtlasFrame]]:
         return self._animated_objects.copy()
 
     @property
-    def enemies(self) -> dict[str, dict[EnemyState, list[pygame.Surface]]]:
+    def enemies(self) -> dict[str, dict[EnemyState, list[AtlasFrame]]]:
         return self._enemies.copy()
 
     @property
-    def weapons(self) -> dict[str, dict[str, list[pygame.Surface] | pygame.Surface]]:
+    def weapons(self) -> dict[str, dict[str, list[AtlasFrame] | AtlasFrame]]:
         return self._weapons.copy()
 
+    @property
+    def sprite_atlases(self) -> list[pygame.Surface]:
+        return self._sprite_atlas.atlases.copy()
+
     @property
     def game_over_cta(self) -> pygame.Surface:
         return self._cta_screens["game_over"]
@@ -119,20 +139,48 @@ class AssetLoader:
         return walls
 
     @classmethod
-    def _load_static_sprites(cls) -> dict[str, pygame.Surface]:
+    def _load_floor_textures(cls) -> dict[int, pygame.Surface]:
+        """
+        Loads all floor and ceiling textures from the assets/floors directory.
+        """
+        floors = {}
+        for file in os.listdir(cls.FLOOR_TEXTURES_PATH):
+            file_path = os.path.join(cls.FLOOR_TEXTURES_PATH, file)
+            key = int(os.path.splitext(file)[0])
+            surface = pygame.image.load(file_path).convert()
+            floors[key] = cls._resize_to_cell_size(surface)
+        return floors
+
+    @classmethod
+    def _split_wall_columns(
+        cls, walls: dict[int, pygame.Surface]
+    ) -> dict[int, tuple[pygame.Surface, ...]]:
         """
-        Loads all static sprites from the assets/objects/static directory.
+        Splits every wall texture into 1 pixel wide columns sharing the texture's pixels.
+        """
+        return {
+            key: tuple(
+                texture.subsurface(x, 0, 1, texture.get_height())
+                for x in range(texture.get_width())
+            )
+            for key, texture in walls.items()
+        }
+
+    @classmethod
+    def _load_static_sprites(cls) -> dict[str, AtlasFrame]:
+        """
+        Loads all static sprites from the assets/objects/static directory into one atlas group.
         """
         static_objects = {}
         for file in os.listdir(cls.STATIC_SPRITES_PATH):
             file_path = os.path.join(cls.STATIC_SPRITES_PATH, file)
             key = str(os.path.splitext(file)[0])
             surface = pygame.image.load(file_path).convert_alpha()
-            static_objects[key] = cls._resize_to_cell_size(surface)
-        return static_objects
+            static_objects[key] = [cls._resize_to_cell_size(surface)]
+        return {key: frames[0] for key, frames in cls._pack(static_objects).items()}
 
     @classmethod
-    def _load_animated_sprites(cls) -> dict[str, list[pygame.Surface]]:
+    def _load_animated_sprites(cls) -> dict[str, list[AtlasFrame]]:
         """
         Loads all animated sprites from the assets/objects/animated directory.
         """
@@ -143,12 +191,14 @@ class AssetLoader:
             animated_objects[dir] = cls._load_sprites_to_list(
                 animated_objects[dir], dir_path
             )
+            animated_objects[dir] = cls._pack({dir: animated_objects[dir]})[dir]
         return animated_objects
 
     @classmethod
-    def _load_enemies(cls) -> dict[str, dict[EnemyState, list[pygame.Surface]]]:
+    def _load_enemies(cls) -> dict[str, dict[EnemyState, list[AtlasFrame]]]:
         """
-        Loads all enemies from the assets/objects/enemies directory.
+        Loads all enemies from the assets/objects/enemies directory, packing the animations of
+        each enemy into one atlas group.
         """
         enemies = {}
         for dir in os.listdir(cls.ENEMIES_SPRITES_PATH):
@@ -164,16 +214,18 @@ class AssetLoader:
                 )
                 sound_path = os.path.join(sound_dir_path, f"{state.value}.mp3")
                 enemies[dir]["sound"][state] = pygame.mixer.Sound(sound_path)
+            enemies[dir].update(
+                cls._pack({state: enemies[dir][state] for state in EnemyState})
+            )
         return enemies
 
     @classmethod
     def _load_weapons(
         cls,
-    ) -> dict[
-        str, dict[str, list[pygame.Surface] | pygame.Surface | pygame.mixer.Sound]
-    ]:
+    ) -> dict[str, dict[str, list[AtlasFrame] | AtlasFrame | pygame.mixer.Sound]]:
         """
-        Loads all weapons from the assets/objects/weapons directory.
+        Loads all weapons from the assets/objects/weapons directory, packing the representations
+        of each weapon into one atlas group.
         """
         weapons = {}
         for dir in os.listdir(cls.WEAPONS_PATH):
@@ -196,7 +248,11 @@ class AssetLoader:
             weapons[dir][sprite] = []
             weapons[dir][sprite] = cls._load_sprites_to_list(
                 weapons[dir][sprite], sprite_path
-            )[0]
+            )[:1]
+            weapons[dir].update(
+                cls._pack({gui: weapons[dir][gui], sprite: weapons[dir][sprite]})
+            )
+            weapons[dir][sprite] = weapons[dir][sprite][0]
             weapons[dir][sound] = cls._load_weapon_sounds(sound_path)
         return weapons
 
@@ -232,6 +288,25 @@ class AssetLoader:
             collection.append(surface)
         return collection
 
+    @classmethod
+    def _pack(
+        cls, groups: dict[Hashable, list[pygame.Surface]]
+    ) -> dict[Hashable, list[AtlasFrame]]:
+        """
+        Packs the sprites of all groups into shared atlases, so that the loaded surfaces can be
+        freed.
+
+        :param groups: sprites by group
+        :return: Atlas frames of the sprites by group
+        """
+        frames = cls._sprite_atlas.pack(
+            [surface for surfaces in groups.values() for surface in surfaces]
+        )
+        packed = {}
+        for key, surfaces in groups.items():
+            packed[key], frames = frames[: len(surfaces)], frames[len(surfaces) :]
+        return packed
+
     @classmethod
     def _resize_to_cell_size(cls, surface: pygame.Surface) -> pygame.Surface:
         """
@@ -4,8 +4,9 @@ import pygame
 from raycaster.core import Settings
 from raycaster.game.player import Player
 from raycaster.game.map import Map
+from raycaster.game.quality_governor import QualityGovernor
 from raycaster.game.game_state_manager import GameStateManager
-from raycaster.rendering import WorldRenderer, GuiRenderer, Raycaster
+from raycaster.rendering import WorldRenderer, GuiRenderer, Raycaster, Presenter
 from raycaster.objects import ObjectManager
 from raycaster import const
 
@@ -17,7 +18,7 @@ class Game:
     screen: pygame.Surface
     delta_time: int
 
-    def __new__(cls):
+    def __new__(cls, clock: pygame.time.Clock | None = None):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
 
@@ -26,8 +27,10 @@ class Game:
             pygame.mouse.set_visible(False)
             cls.settings = Settings()
             cls.screen = pygame.display.set_mode(const.RESOLUTION)
+            cls.presenter = Presenter(cls.screen)
             cls.delta_time = 1
-            cls.clock = pygame.time.Clock()
+            cls.clock = pygame.time.Clock() if clock is None else clock
+            cls.quality_governor = QualityGovernor()
             cls.map = Map()
             cls.player = Player(cls.clock, cls.map)
             cls.raycaster = Raycaster(cls.map, cls.player)
@@ -37,7 +40,7 @@ class Game:
                 cls.screen, cls.map, cls.player, cls.raycaster
             )
             cls.game_state_manager = GameStateManager(
-                cls.player, cls.object_manager, cls.gui_renderer
+                cls.player, cls.object_manager, cls.gui_renderer, cls.presenter
             )
             cls._play_soundtrack()
 
@@ -67,6 +70,8 @@ class Game:
             ):
                 pygame.quit()
                 sys.exit()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.game_state_manager.invalidate()
 
             self.game_state_manager.handle_events(event)
 
@@ -75,8 +80,13 @@ class Game:
         Updates the game state.
         """
         self.game_state_manager.update()
-        pygame.display.flip()
-        self.delta_time = self.clock.tick(self.settings.FPS)
+        self.presenter.present()
+        if self.game_state_manager.is_static():
+            # Nothing moves on static screens, so there is no need to spin at full speed
+            self.delta_time = self.clock.tick(self.settings.IDLE_FPS)
+        else:
+            self.delta_time = self.clock.tick(self.settings.FPS)
+            self.quality_governor.update(self.clock.get_rawtime())
         pygame.display.set_caption(f"{const.CAPTION} - {self.clock.get_fps() :.1f}")
 
     def draw(self):
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from raycaster.game.player import Player
     from raycaster.objects import ObjectManager
     from raycaster.rendering.gui_renderer import GuiRenderer
+    from raycaster.rendering.presenter import Presenter
 
 
 class GameState(Enum):
@@ -26,16 +27,33 @@ class GameStateManager:
         player: "Player",
         object_manager: "ObjectManager",
         gui_renderer: "GuiRenderer",
+        presenter: "Presenter",
     ):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls.player = player
             cls.object_manager = object_manager
             cls.gui_renderer = gui_renderer
+            cls.presenter = presenter
             cls.settings = Settings()
             cls.current_state = GameState.START
+            cls._drawn_state = None
         return cls._instance
 
+    @classmethod
+    def is_static(cls) -> bool:
+        """
+        Checks if the current screen stays the same until the state changes.
+        """
+        return cls.current_state != GameState.GAMEPLAY
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Makes the next draw redraw the screen even if it has not changed.
+        """
+        cls._drawn_state = None
+
     @classmethod
     def handle_events(cls, event: pygame.event.Event):
         if cls.current_state == GameState.START:
@@ -57,6 +75,11 @@ class GameStateManager:
 
     @classmethod
     def draw(cls):
+        if cls.is_static() and cls._drawn_state == cls.current_state:
+            return
+        cls._drawn_state = cls.current_state
+        cls.presenter.mark_dirty()
+
         if cls.current_state == GameState.GAMEPLAY:
             Drawable.draw_all()
             cls.gui_renderer.draw_hud()
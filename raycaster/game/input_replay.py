@@ -0,0 +1,50 @@
+class PressedKeys:
+    """
+    Keyboard state indexed by key constants, like the result of pygame.key.get_pressed.
+    """
+
+    def __init__(self, keys: tuple[int, ...] = ()):
+        self._keys = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._keys
+
+
+class InputReplay:
+    """
+    Recorded keyboard input that stands in for pygame.key.get_pressed.
+
+    The recording is a sequence of segments, each holding the keys pressed during a number of
+    consecutive frames.
+    """
+
+    def __init__(self, segments: list[tuple[int, tuple[int, ...]]]):
+        self._frames = [
+            PressedKeys(keys) for frames, keys in segments for _ in range(frames)
+        ]
+        self._frame_index = -1
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._frames)
+
+    @property
+    def finished(self) -> bool:
+        return self._frame_index >= len(self._frames) - 1
+
+    def advance(self):
+        """
+        Moves the replay to the next frame.
+        """
+        self._frame_index = min(self._frame_index + 1, len(self._frames) - 1)
+
+    def rewind(self):
+        """
+        Moves the replay back before the first frame.
+        """
+        self._frame_index = -1
+
+    def __call__(self) -> PressedKeys:
+        if self._frame_index < 0:
+            return PressedKeys()
+        return self._frames[self._frame_index]
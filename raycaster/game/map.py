@@ -1,8 +1,15 @@
+import numpy as np
+
 from raycaster.core import Settings
 
 
 class Map:
-    def __init__(self, level: list[list[int]] = None):
+    def __init__(
+        self,
+        level: list[list[int]] = None,
+        floor: list[list[int]] = None,
+        ceiling: list[list[int]] = None,
+    ):
         self.level = (
             [
                 [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
@@ -64,16 +71,126 @@ class Map:
         )
         self.rows = len(self.level)
         self.cols = len(self.level[0])
+        self._grid = np.array(self.level, dtype=np.uint8)
+        self._floor_grid = self._texture_grid(floor, 1)
+        self._ceiling_grid = self._texture_grid(ceiling, 2)
         self._walls = self._locate_walls()
+        self._distance_field = self._compute_distance_field()
+        self._occupancy_pyramid = self._build_occupancy_pyramid()
         self.settings = Settings()
 
+    def _texture_grid(
+        self, textures: list[list[int]] | None, default_texture_id: int
+    ) -> np.ndarray:
+        """
+        Creates a grid of per-cell texture ids, using the default texture for every cell if none
+        are given.
+        """
+        if textures is None:
+            return np.full((self.rows, self.cols), default_texture_id, dtype=np.uint8)
+        return np.array(textures, dtype=np.uint8)
+
     def _locate_walls(self) -> list[tuple[int, int]]:
-        walls = []
-        for y, row in enumerate(self.level):
-            for x, cell in enumerate(row):
-                if cell != 0:
-                    walls.append((x, y))
-        return walls
+        return [(x, y) for y, x in np.argwhere(self._grid).tolist()]
+
+    def _compute_distance_field(self) -> np.ndarray:
+        """
+        Computes the Chebyshev distance in cells from every cell to the nearest wall.
+
+        Cells outside the level count as walls, so no jump based on the field leaves the level.
+        """
+        reached = np.pad(self._grid != 0, 1, constant_values=True)
+        distance = np.zeros(reached.shape, dtype=np.int64)
+        rows, cols = reached.shape
+        steps = 0
+        while not reached.all():
+            steps += 1
+            padded = np.pad(reached, 1)
+            grown = reached.copy()
+            for dy in range(3):
+                for dx in range(3):
+                    grown |= padded[dy : dy + rows, dx : dx + cols]
+            distance[grown & ~reached] = steps
+            reached = grown
+        return np.minimum(distance[1:-1, 1:-1], 255).astype(np.uint8)
+
+    def _build_occupancy_pyramid(self) -> list[np.ndarray]:
+        """
+        Builds coarser occupancy grids, each cell covering 2x2 cells of the previous level.
+        """
+        pyramid = [self._grid != 0]
+        while max(pyramid[-1].shape) > 1:
+            level = pyramid[-1]
+            rows, cols = level.shape
+            level = np.pad(level, ((0, rows % 2), (0, cols % 2)))
+            rows, cols = level.shape
+            pyramid.append(level.reshape(rows // 2, 2, cols // 2, 2).any(axis=(1, 3)))
+        return pyramid
+
+    @property
+    def grid(self) -> np.ndarray:
+        """
+        Gets the occupancy grid of the level indexed by row and column.
+
+        :return: Texture id of every cell, 0 for empty cells
+        """
+        return self._grid
+
+    @property
+    def floor_grid(self) -> np.ndarray:
+        """
+        Gets the texture ids of the floor indexed by row and column.
+
+        :return: Array of ids of the textures in assets/floors
+        """
+        return self._floor_grid
+
+    @property
+    def ceiling_grid(self) -> np.ndarray:
+        """
+        Gets the texture ids of the ceiling indexed by row and column.
+
+        :return: Array of ids of the textures in assets/floors
+        """
+        return self._ceiling_grid
+
+    @property
+    def distance_field(self) -> np.ndarray:
+        """
+        Gets the distance from every cell to the nearest wall indexed by row and column.
+
+        :return: Chebyshev distance in cells, 0 for walls, capped at 255
+        """
+        return self._distance_field
+
+    @property
+    def occupancy_pyramid(self) -> list[np.ndarray]:
+        """
+        Gets the occupancy grids of the level from the finest to the coarsest.
+
+        :return: Grids where a cell of level n is occupied if any of the 2^n x 2^n level cells it
+            covers is a wall
+        """
+        return self._occupancy_pyramid
+
+    def is_area_empty(self, x_min: int, y_min: int, x_max: int, y_max: int) -> bool:
+        """
+        Checks if there are no walls in a rectangle of cells using the coarsest fitting grid.
+
+        The check is conservative, it may report walls just outside the rectangle.
+
+        :param x_min: first column of the rectangle
+        :param y_min: first row of the rectangle
+        :param x_max: last column of the rectangle
+        :param y_max: last row of the rectangle
+        :return: True if the rectangle has no walls, False otherwise
+        """
+        level = max(x_max - x_min, y_max - y_min).bit_length()
+        level = min(level, len(self._occupancy_pyramid) - 1)
+        occupancy = self._occupancy_pyramid[level]
+        return not occupancy[
+            y_min >> level : (y_max >> level) + 1, x_min >> level : (x_max >> level) + 1
+        ].any()
 
     @property
     def walls(self) -> list[tuple[int, int]]:
@@ -92,7 +209,17 @@ class Map:
         :param y: row index
         :return: True if the given coordinates are a wall, False otherwise
         """
-        return (x, y) in self.walls
+        return not self.is_out_of_bounds(x, y) and self._grid.item(y, x) != 0
+
+    def get_texture_id(self, x: int, y: int) -> int:
+        """
+        Gets the texture id of the given cell.
+
+        :param x: column index
+        :param y: row index
+        :return: Texture id of the cell, 0 if the cell is empty
+        """
+        return self._grid.item(y, x)
 
     def is_out_of_bounds(self, x: int, y: int) -> bool:
         """
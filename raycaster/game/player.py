@@ -1,5 +1,5 @@
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Sequence
 import pygame
 
 from raycaster.core import Updatable, Settings, Event
@@ -11,10 +11,16 @@ if TYPE_CHECKING:
 
 
 class Player(Updatable):
-    def __init__(self, clock: pygame.time.Clock, map: "Map"):
+    def __init__(
+        self,
+        clock: pygame.time.Clock,
+        map: "Map",
+        get_pressed_keys: Callable[[], Sequence[bool]] = pygame.key.get_pressed,
+    ):
         self.map = map
         self.settings = Settings()
         self.clock = clock
+        self.get_pressed_keys = get_pressed_keys
         self.speed = self.settings.PLAYER_SPEED
         self.sensitivity = self.settings.PLAYER_SENSITIVITY
         self.x = 3.5 * self.settings.CELL_SIZE
@@ -55,7 +61,7 @@ class Player(Updatable):
         speed_sin = speed * sin_a
         speed_cos = speed * cos_a
 
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed_keys()
         num_key_pressed = -1
         if keys[pygame.K_w]:
             num_key_pressed += 1
@@ -99,7 +105,7 @@ class Player(Updatable):
         return angle_deg >= fov_start or angle_deg <= fov_end
 
     def handle_camera(self):
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed_keys()
         if keys[pygame.K_LEFT]:
             self.angle -= self.sensitivity * self.delta_time
             self.angle = self.angle % (2 * math.pi)
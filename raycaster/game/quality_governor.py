@@ -0,0 +1,99 @@
+from raycaster.core import Settings
+from raycaster import const
+
+
+class QualityGovernor:
+    """
+    Adjusts the ray count and the render scale between the configured bounds to keep the frame
+    time within budget.
+
+    The frame time is smoothed and the quality only changes when the smoothed time leaves the
+    band between the low and the high ratio of the budget, at most once per adjust interval.
+    The ray count is lowered first and the render scale only once the ray count is at its
+    minimum. The quality is raised back in the reverse order.
+    """
+
+    def __init__(self):
+        self.settings = Settings()
+        self.average_frame_time = None
+        self._frames_since_adjustment = 0
+
+    @property
+    def frame_budget(self) -> float:
+        """
+        Gets the time available for a single frame.
+
+        :return: Frame budget in milliseconds
+        """
+        return 1000 / self.settings.FPS
+
+    def update(self, frame_time: float):
+        """
+        Records the time of the last frame and adjusts the quality if needed.
+
+        :param frame_time: time spent on the last frame in milliseconds, without the tick delay
+        """
+        if not self.settings.ADAPTIVE_QUALITY:
+            return
+        if self.average_frame_time is None:
+            self.average_frame_time = frame_time
+        else:
+            self.average_frame_time += 0.1 * (frame_time - self.average_frame_time)
+
+        self._frames_since_adjustment += 1
+        if self._frames_since_adjustment < self.settings.QUALITY_ADJUST_INTERVAL:
+            return
+
+        step = self.settings.QUALITY_STEP
+        if (
+            self.average_frame_time
+            > self.frame_budget * self.settings.FRAME_TIME_HIGH_RATIO
+        ):
+            if not self._set_ray_count(self.settings.RAY_COUNT * (1 - step)):
+                self._set_render_scale(self.settings.RENDER_SCALE * (1 - step))
+        elif (
+            self.average_frame_time
+            < self.frame_budget * self.settings.FRAME_TIME_LOW_RATIO
+        ):
+            if not self._set_render_scale(self.settings.RENDER_SCALE * (1 + step)):
+                self._set_ray_count(self.settings.RAY_COUNT * (1 + step))
+
+    def _set_ray_count(self, ray_count: float) -> bool:
+        """
+        Changes the ray count within bounds and rebuilds the tables depending on it.
+
+        :param ray_count: requested ray count
+        :return: True if the ray count has changed, False if it is already at the bound
+        """
+        ray_count = round(
+            min(
+                max(ray_count, self.settings.MIN_RAY_COUNT), self.settings.MAX_RAY_COUNT
+            )
+        )
+        if ray_count == self.settings.RAY_COUNT:
+            return False
+        self.settings.RAY_COUNT = ray_count
+        const.refresh_projection_constants()
+        self._frames_since_adjustment = 0
+        return True
+
+    def _set_render_scale(self, render_scale: float) -> bool:
+        """
+        Changes the render scale within bounds and rebuilds the tables depending on it.
+
+        :param render_scale: requested render scale
+        :return: True if the render scale has changed, False if it is already at the bound
+        """
+        render_scale = round(
+            min(
+                max(render_scale, self.settings.MIN_RENDER_SCALE),
+                self.settings.MAX_RENDER_SCALE,
+            ),
+            2,
+        )
+        if render_scale == self.settings.RENDER_SCALE:
+            return False
+        self.settings.RENDER_SCALE = render_scale
+        const.refresh_projection_constants()
+        self._frames_since_adjustment = 0
+        return True
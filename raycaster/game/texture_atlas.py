@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+import pygame
+
+
+@dataclass(eq=False)
+class AtlasFrame:
+    """
+    Sprite frame stored as an area of a texture atlas.
+    """
+
+    atlas: pygame.Surface
+    rect: pygame.Rect
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.rect.size
+
+    @property
+    def width(self) -> int:
+        return self.rect.width
+
+    @property
+    def height(self) -> int:
+        return self.rect.height
+
+
+class TextureAtlas:
+    """
+    Packs sprite frames into a few large surfaces at load time.
+
+    The frames are stacked on top of each other, so the rows of a frame stay next to each other
+    in memory and blitting a frame's area reads the same pixels as blitting a standalone surface.
+    A new atlas is started when the next frame would make the current one taller than the
+    maximum height.
+    """
+
+    def __init__(self, max_height: int):
+        self.max_height = max_height
+        self.atlases: list[pygame.Surface] = []
+
+    def pack(self, surfaces: list[pygame.Surface]) -> list[AtlasFrame]:
+        """
+        Copies the surfaces into new atlases.
+
+        :param surfaces: surfaces with per pixel alpha to pack
+        :return: Frames of the surfaces in the same order
+        """
+        pages: list[list[pygame.Surface]] = []
+        page_height = 0
+        for surface in surfaces:
+            if not pages or page_height + surface.get_height() > self.max_height:
+                pages.append([])
+                page_height = 0
+            pages[-1].append(surface)
+            page_height += surface.get_height()
+
+        frames = []
+        for page in pages:
+            width = max(surface.get_width() for surface in page)
+            height = sum(surface.get_height() for surface in page)
+            atlas = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+            atlas.fill((0, 0, 0, 0))
+            y = 0
+            for surface in page:
+                # The atlas is transparent black, so the maximum copies the pixels unblended
+                rect = atlas.blit(surface, (0, y), special_flags=pygame.BLEND_RGBA_MAX)
+                frames.append(AtlasFrame(atlas, rect))
+                y += surface.get_height()
+            self.atlases.append(atlas)
+        return frames
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(atlas.get_pitch() * atlas.get_height() for atlas in self.atlases)
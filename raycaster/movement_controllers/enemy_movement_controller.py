@@ -27,7 +27,7 @@ class EnemyMovementController(BaseMovementController):
             enemy, objects
         ) and not cls._collides_with_player(enemy):
             new_position = cls._generate_new_position(enemy, map)
-            enemy.x, enemy.y = new_position
+            enemy.set_position(*new_position)
 
     @staticmethod
     def _collides_with_objects(enemy: "Enemy", objects: list["SpriteObject"]) -> bool:
@@ -1,3 +1,5 @@
 from raycaster.objects.object_manager import ObjectManager
 from raycaster.objects.object_factory import ObjectFactory
 from raycaster.objects.sprite_object import SpriteObject
+from raycaster.objects.sprite_batch import SpriteBatch
+from raycaster.objects.spatial_index import SpatialIndex
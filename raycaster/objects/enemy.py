@@ -8,6 +8,7 @@ from raycaster.objects.animated_sprite_object import AnimatedSpriteObject, Anima
 from raycaster.game import AssetLoader
 from raycaster.core import Settings, Event
 from raycaster.const import EnemyState, EFFECTS_VOLUME
+from raycaster.utils import get_ticks
 
 
 if TYPE_CHECKING:
@@ -98,8 +99,7 @@ class Enemy(AnimatedSpriteObject):
             self._draw_hit()
             self._play_sound(EnemyState.ATTACK)
         self.attack_timer = (
-            pygame.time.get_ticks()
-            + self.animations.get(EnemyState.ATTACK).duration * 1000
+            get_ticks() + self.animations.get(EnemyState.ATTACK).duration * 1000
         )
         self._change_animation(EnemyState.ATTACK)
         self.state = EnemyState.ATTACK
@@ -164,7 +164,7 @@ class Enemy(AnimatedSpriteObject):
     def _attack_on_cooldown(self) -> bool:
         if self.attack_timer == 0:
             return False
-        return pygame.time.get_ticks() - self.attack_timer < self.attack_cooldown * 1000
+        return get_ticks() - self.attack_timer < self.attack_cooldown * 1000
 
     def _finished_attack(self) -> bool:
         return (
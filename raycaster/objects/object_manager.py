@@ -1,20 +1,24 @@
 from typing import TYPE_CHECKING
+import math
 
+from raycaster.objects.enemy import Enemy
 from raycaster.objects.object_factory import ObjectFactory
+from raycaster.objects.spatial_index import SpatialIndex
+from raycaster.objects.sprite_batch import SpriteBatch
+from raycaster.objects.weapons import Weapon
 from raycaster.rendering.sprite_projection_processor import SpriteProjectionProcessor
 from raycaster.movement_controllers import (
     EnemyMovementController,
     PlayerMovementController,
 )
 from raycaster.rendering.raycaster import Raycaster
-from raycaster.core import Settings, Updatable
+from raycaster.rendering.line_of_sight import LineOfSight
+from raycaster.core import Event, Settings, Updatable
 
 if TYPE_CHECKING:
     from raycaster.game import Player
     from raycaster.objects.sprite_object import SpriteObject
-    from raycaster.objects.enemy import Enemy
     from raycaster.game.map import Map
-    from raycaster.objects.weapons import Weapon
 
 
 class ObjectManager:
@@ -26,6 +30,15 @@ class ObjectManager:
             cls.player = player
             cls.raycaster = raycaster
             cls.map = map
+            cls.line_of_sight = LineOfSight(map)
+            cls.sprite_removed_handler = Event()
+            SpriteBatch.raycaster = raycaster
+            SpriteProjectionProcessor.raycaster = raycaster
+            # Created before the sprites, so that it is updated before them
+            cls.sprite_batch = SpriteBatch(player)
+            cls.sprite_removed_handler += cls.sprite_batch.remove
+            cls.spatial_index = SpatialIndex()
+            cls.sprite_removed_handler += cls.spatial_index.remove
             ObjectFactory.add_player(player)
             cls._initialize_objects()
             cls._register_event_handlers()
@@ -43,6 +56,10 @@ class ObjectManager:
     def weapons(self) -> tuple["Weapon"]:
         return tuple(self._weapons)
 
+    @classmethod
+    def _get_sprites(cls) -> tuple["SpriteObject"]:
+        return (*cls._objects, *cls._enemies, *cls._weapons)
+
     @classmethod
     def _initialize_objects(cls):
         cell_size = Settings().CELL_SIZE
@@ -171,47 +188,91 @@ class ObjectManager:
             cls.player.add_score(enemy.score)
             cls._enemies.remove(enemy)
             Updatable.unregister(enemy)
+            cls.sprite_removed_handler.invoke(enemy)
 
     @classmethod
     def _on_enemy_position_update(cls, enemy: "Enemy"):
-        enemies = cls._enemies.copy()
-        objects = cls._objects.copy()
-        objects = [*enemies, *objects]
+        objects = cls._get_obstacles(
+            enemy.x, enemy.y, enemy.hitbox_radius + cls.spatial_index.max_hitbox_radius
+        )
         EnemyMovementController.update_position(enemy, cls.map, objects)
 
     @classmethod
     def _on_enemy_attack(cls, enemy: "Enemy"):
-        ray = cls.raycaster.cast_ray(enemy.angle)
-        if not (ray.hit_wall and ray.length < enemy.distance):
+        if cls.line_of_sight.has_los((enemy.x, enemy.y), (cls.player.x, cls.player.y)):
             cls.player.apply_damage(enemy.damage)
 
     @classmethod
     def _on_player_shot(cls):
-        ray = cls.raycaster.cast_ray(cls.player.angle)
-        for enemy in sorted(cls._enemies, key=lambda e: e.distance):
-            if (
-                SpriteProjectionProcessor.intersects_screen_center(enemy)
-                and not (ray.hit_wall and ray.length < enemy.distance)
-                and cls.player.in_fov(enemy.angle)
-            ):
+        settings = Settings()
+        nearby_enemies = [
+            sprite
+            for sprite in cls.spatial_index.query_view_cone(
+                cls.player.x,
+                cls.player.y,
+                cls.raycaster.view_angle,
+                math.radians(settings.FOV),
+                settings.MAX_DISTANCE,
+            )
+            if isinstance(sprite, Enemy)
+        ]
+        targets = [
+            enemy
+            for enemy in sorted(nearby_enemies, key=lambda e: e.distance)
+            if SpriteProjectionProcessor.intersects_screen_center(enemy)
+            and enemy.in_fov
+        ]
+        if not targets:
+            return
+        visible = cls.line_of_sight.has_los_many(
+            [(cls.player.x, cls.player.y)] * len(targets),
+            [(enemy.x, enemy.y) for enemy in targets],
+        )
+        for enemy, is_visible in zip(targets, visible.tolist()):
+            if is_visible:
                 enemy.apply_damage(cls.player.weapon.damage)
                 return
 
     @classmethod
     def reset(cls):
+        for sprite in cls._get_sprites():
+            cls.sprite_removed_handler.invoke(sprite)
         cls._remove_all_objects()
         cls._initialize_objects()
         cls._register_event_handlers()
 
     @classmethod
     def _remove_all_objects(cls):
-        for enemy in cls._enemies:
-            cls._enemies.remove(enemy)
-            Updatable.unregister(enemy)
+        for sprite in cls._get_sprites():
+            Updatable.unregister(sprite)
+        cls._objects.clear()
+        cls._enemies.clear()
+        cls._weapons.clear()
 
     @classmethod
     def _on_player_position_update(cls, dx: float, dy: float):
-        enemies = cls._enemies.copy()
-        objects = cls._objects.copy()
-        objects = [*enemies, *objects]
+        objects = cls._get_obstacles(
+            cls.player.x,
+            cls.player.y,
+            cls.player.hitbox_radius
+            + cls.spatial_index.max_hitbox_radius
+            + math.hypot(dx, dy),
+        )
         PlayerMovementController.update_position(cls.player, (dx, dy), cls.map, objects)
+
+    @classmethod
+    def _get_obstacles(cls, x: float, y: float, radius: float) -> list["SpriteObject"]:
+        """
+        Finds the objects and enemies near a point that can be collided with, weapons are
+        picked up instead.
+
+        :param x: x coordinate of the point
+        :param y: y coordinate of the point
+        :param radius: searched radius
+        :return: Objects and enemies within the radius
+        """
+        return [
+            sprite
+            for sprite in cls.spatial_index.query_radius(x, y, radius)
+            if not isinstance(sprite, Weapon)
+        ]
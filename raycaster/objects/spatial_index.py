@@ -0,0 +1,139 @@
+from typing import TYPE_CHECKING
+import math
+
+from raycaster.core import Settings
+
+if TYPE_CHECKING:
+    from raycaster.objects.sprite_object import SpriteObject
+
+
+class SpatialIndex:
+    """
+    Uniform grid of the sprites, keyed by the map cell they stand in.
+
+    Queries look only at the cells around the searched area, so their cost depends on the number
+    of sprites nearby instead of the number of sprites on the whole map.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls.cell_size = Settings().CELL_SIZE
+            cls.max_hitbox_radius = 0.0
+            cls._cells: dict[tuple[int, int], list["SpriteObject"]] = {}
+            cls._sprite_cells: dict["SpriteObject", tuple[int, int]] = {}
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._sprite_cells)
+
+    def _get_cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def add(self, sprite: "SpriteObject"):
+        """
+        Adds a sprite to the cell it stands in.
+
+        :param sprite: added sprite
+        """
+        cell = self._get_cell(sprite.x, sprite.y)
+        self._cells.setdefault(cell, []).append(sprite)
+        self._sprite_cells[sprite] = cell
+        self.max_hitbox_radius = max(self.max_hitbox_radius, sprite.hitbox_radius)
+
+    def remove(self, sprite: "SpriteObject"):
+        """
+        Removes a sprite from the index.
+
+        :param sprite: removed sprite
+        """
+        cell = self._sprite_cells.pop(sprite, None)
+        if cell is None:
+            return
+        sprites = self._cells[cell]
+        sprites.remove(sprite)
+        if not sprites:
+            del self._cells[cell]
+
+    def move(self, sprite: "SpriteObject"):
+        """
+        Moves a sprite to another cell if its position has left the old one.
+
+        :param sprite: moved sprite
+        """
+        cell = self._get_cell(sprite.x, sprite.y)
+        if self._sprite_cells.get(sprite, cell) != cell:
+            self.remove(sprite)
+            self.add(sprite)
+
+    def query_cell(self, column: int, row: int) -> list["SpriteObject"]:
+        """
+        Finds the sprites standing in a map cell.
+
+        :param column: column of the cell
+        :param row: row of the cell
+        :return: Sprites in the cell
+        """
+        return list(self._cells.get((column, row), ()))
+
+    def query_radius(self, x: float, y: float, radius: float) -> list["SpriteObject"]:
+        """
+        Finds the sprites whose position is within the radius from a point.
+
+        :param x: x coordinate of the point
+        :param y: y coordinate of the point
+        :param radius: searched radius
+        :return: Sprites within the radius
+        """
+        first_column, first_row = self._get_cell(x - radius, y - radius)
+        last_column, last_row = self._get_cell(x + radius, y + radius)
+        columns = range(first_column, last_column + 1)
+        rows = range(first_row, last_row + 1)
+        if len(columns) * len(rows) > len(self._cells):
+            cells = [
+                sprites
+                for (column, row), sprites in self._cells.items()
+                if column in columns and row in rows
+            ]
+        else:
+            cells = [
+                self._cells[column, row]
+                for column in columns
+                for row in rows
+                if (column, row) in self._cells
+            ]
+
+        squared_radius = radius * radius
+        return [
+            sprite
+            for sprites in cells
+            for sprite in sprites
+            if (sprite.x - x) ** 2 + (sprite.y - y) ** 2 <= squared_radius
+        ]
+
+    def query_view_cone(
+        self, x: float, y: float, angle: float, fov: float, max_distance: float
+    ) -> list["SpriteObject"]:
+        """
+        Finds the sprites whose position is inside a view cone.
+
+        :param x: x coordinate of the cone's apex
+        :param y: y coordinate of the cone's apex
+        :param angle: direction of the cone in radians
+        :param fov: angle of the cone in radians
+        :param max_distance: length of the cone
+        :return: Sprites inside the cone
+        """
+        half_fov = fov / 2
+        return [
+            sprite
+            for sprite in self.query_radius(x, y, max_distance)
+            if abs(
+                (math.atan2(sprite.y - y, sprite.x - x) - angle + math.pi)
+                % (2 * math.pi)
+                - math.pi
+            )
+            <= half_fov
+        ]
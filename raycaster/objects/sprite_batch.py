@@ -0,0 +1,130 @@
+from typing import TYPE_CHECKING
+import math
+
+import numpy as np
+
+from raycaster.core import Settings, Updatable
+from raycaster.utils import calculate_distance
+
+if TYPE_CHECKING:
+    from raycaster.game import Player
+    from raycaster.objects.sprite_object import SpriteObject
+    from raycaster.rendering.raycaster import Raycaster
+
+
+class SpriteBatch(Updatable):
+    """
+    Positions of all sprites kept in shared arrays, with the distance, the angle and the field of
+    view check calculated for all of them in a single step per frame. The field of view is the
+    one the walls were cast in, so it is checked against the raycaster's view angle.
+
+    The batch is updated after the player and before the sprites. The results are kept in arrays
+    and copied to the sprites' attributes, which are read far more often than they change. Sprites
+    are moved with SpriteObject.set_position, which keeps their row of the arrays up to date.
+    """
+
+    _instance = None
+    raycaster: "Raycaster" = None
+
+    def __new__(cls, player: "Player"):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls.player = player
+            cls.settings = Settings()
+            cls.sprites: list["SpriteObject"] = []
+            cls.positions = np.zeros((16, 2))
+            cls.distances = np.zeros(16)
+            cls.angles = np.zeros(16)
+            cls.in_fov = np.zeros(16, dtype=bool)
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def add(self, sprite: "SpriteObject", position: tuple[float, float]) -> int:
+        """
+        Adds a sprite to the batch and calculates its values right away.
+
+        :param sprite: added sprite
+        :param position: position of the sprite
+        :return: Index of the sprite in the batch
+        """
+        index = len(self.sprites)
+        if index == len(self.positions):
+            self.positions = np.concatenate((self.positions, self.positions))
+            self.distances = np.concatenate((self.distances, self.distances))
+            self.angles = np.concatenate((self.angles, self.angles))
+            self.in_fov = np.concatenate((self.in_fov, self.in_fov))
+        self.sprites.append(sprite)
+        self.move(index, *position)
+        return index
+
+    def remove(self, sprite: "SpriteObject"):
+        """
+        Removes a sprite from the batch, moving the last sprite into its place.
+
+        :param sprite: removed sprite
+        """
+        index, last = sprite.batch_index, len(self.sprites) - 1
+        if index > last or self.sprites[index] is not sprite:
+            return
+        moved = self.sprites.pop()
+        if index != last:
+            self.sprites[index] = moved
+            moved.batch_index = index
+            for values in (self.positions, self.distances, self.angles, self.in_fov):
+                values[index] = values[last]
+
+    def move(self, index: int, x: float, y: float):
+        """
+        Changes the position of a sprite and recalculates its values, so that sprites moving
+        during the frame do not lag behind.
+
+        :param index: index of the sprite in the batch
+        :param x: new x coordinate
+        :param y: new y coordinate
+        """
+        sprite = self.sprites[index]
+        sprite.distance = calculate_distance(x, y, self.player.x, self.player.y)
+        sprite.angle = math.atan2(y - self.player.y, x - self.player.x)
+        self.positions[index] = x, y
+        self.distances[index] = sprite.distance
+        self.angles[index] = sprite.angle
+        self._check_fov(self.angles[index : index + 1], self.in_fov[index : index + 1])
+        sprite.in_fov = bool(self.in_fov[index])
+
+    def update(self):
+        count = len(self.sprites)
+        if not count:
+            return
+        deltas = self.positions[:count] - (self.player.x, self.player.y)
+        distances = self.distances[:count]
+        angles = self.angles[:count]
+        in_fov = self.in_fov[:count]
+        np.hypot(deltas[:, 0], deltas[:, 1], out=distances)
+        np.arctan2(deltas[:, 1], deltas[:, 0], out=angles)
+        self._check_fov(angles, in_fov)
+
+        for sprite, distance, angle, visible in zip(
+            self.sprites, distances.tolist(), angles.tolist(), in_fov.tolist()
+        ):
+            sprite.distance = distance
+            sprite.angle = angle
+            sprite.in_fov = visible
+
+    def _check_fov(self, angles: np.ndarray, out: np.ndarray):
+        """
+        Checks which angles are in the field of view around the raycaster's view angle. Done in
+        degrees, the same way as Player.in_fov.
+
+        :param angles: angles from the player to the sprites in radians
+        :param out: array the results are written to
+        """
+        view_dir = math.degrees(self.raycaster.view_angle) % 360
+        fov_start = (view_dir - self.settings.FOV / 2) % 360
+        fov_end = (view_dir + self.settings.FOV / 2) % 360
+        angles_deg = np.degrees(angles) % 360
+        if fov_start < fov_end:
+            np.logical_and(angles_deg >= fov_start, angles_deg <= fov_end, out=out)
+        else:
+            np.logical_or(angles_deg >= fov_start, angles_deg <= fov_end, out=out)
@@ -1,13 +1,13 @@
 from typing import TYPE_CHECKING
-import math
-import pygame
 
 from raycaster.core import Updatable, Settings
 from raycaster.game import AssetLoader
-from raycaster.utils import calculate_distance
+from raycaster.objects.spatial_index import SpatialIndex
+from raycaster.objects.sprite_batch import SpriteBatch
 
 if TYPE_CHECKING:
     from raycaster.game import Player
+    from raycaster.game.texture_atlas import AtlasFrame
 
 
 class SpriteObject(Updatable):
@@ -16,20 +16,35 @@ class SpriteObject(Updatable):
         position: tuple[float, float],
         shaded: bool,
         player: "Player",
-        texture: pygame.Surface,
+        texture: "AtlasFrame",
     ):
         self.x, self.y = position
         self.shaded = shaded
         self.player = player
         self.texture = texture
         self.settings = Settings()
-        self.distance = calculate_distance(self.x, self.y, self.player.x, self.player.y)
-        self.angle = math.atan2(self.y - self.player.y, self.x - self.player.x)
-        self.hitbox_radius = self.texture.get_width() / 2
+        # The batch sets the distance, the angle and in_fov of the sprite
+        self.batch = SpriteBatch(player)
+        self.batch_index = self.batch.add(self, position)
+        self.hitbox_radius = self.texture.width / 2
+        self.spatial_index = SpatialIndex()
+        self.spatial_index.add(self)
+
+    def set_position(self, x: float, y: float):
+        """
+        Moves the object, keeping the sprite batch and the spatial index up to date.
+
+        :param x: new x coordinate
+        :param y: new y coordinate
+        """
+        self.x, self.y = x, y
+        self.batch.move(self.batch_index, x, y)
+        self.spatial_index.move(self)
 
     def update(self):
-        self.distance = calculate_distance(self.x, self.y, self.player.x, self.player.y)
-        self.angle = math.atan2(self.y - self.player.y, self.x - self.player.x)
+        """
+        The distance and the angle are updated by the sprite batch.
+        """
 
 
 class Corps(SpriteObject):
@@ -5,9 +5,11 @@ from raycaster.objects.animated_sprite_object import Animation
 from raycaster.objects.sprite_object import SpriteObject
 from raycaster.game import AssetLoader
 from raycaster.const import WeaponRepresentation, WeaponState
+from raycaster.utils import get_ticks
 
 if TYPE_CHECKING:
     from raycaster.game import Player
+    from raycaster.game.texture_atlas import AtlasFrame
 
 
 class Weapon(SpriteObject):
@@ -16,7 +18,7 @@ class Weapon(SpriteObject):
         player: "Player",
         shooting_animation: "Animation",
         sounds: dict[WeaponState, pygame.mixer.Sound],
-        sprite_representation: pygame.Surface,
+        sprite_representation: "AtlasFrame",
         damage: float,
         attack_range: float,
         attack_cooldown: float,
@@ -39,7 +41,7 @@ class Weapon(SpriteObject):
             player=player,
             texture=sprite_representation,
         )
-        self.PICKUP_RADIUS = self.texture.get_width() / 2
+        self.PICKUP_RADIUS = self.texture.width / 2
 
     @property
     def equipped(self) -> bool:
@@ -51,17 +53,17 @@ class Weapon(SpriteObject):
         self._sounds.get(WeaponState.EQUIP).play()
 
     def unequip(self):
-        self.x, self.y = self.player.x, self.player.y
+        self.set_position(self.player.x, self.player.y)
         self.player.weapon = None
         self._equipped = False
 
     def can_shoot(self) -> bool:
-        return pygame.time.get_ticks() >= self._attack_timer and self.equipped
+        return get_ticks() >= self._attack_timer and self.equipped
 
     def shoot(self):
         self._is_shooting = True
         self._attack_timer = (
-            pygame.time.get_ticks()
+            get_ticks()
             + (self._shooting_animation.duration + self._attack_cooldown) * 1000
         )
         self._sounds.get(WeaponState.SHOOT).play()
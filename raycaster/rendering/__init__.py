@@ -1,5 +1,14 @@
 from raycaster.rendering.gui_renderer import GuiRenderer
 from raycaster.rendering.world_renderer import WorldRenderer
 from raycaster.rendering.object_renderer import ObjectRenderer
-from raycaster.rendering.ray import Ray
+from raycaster.rendering.ray import Ray, RayBuffer, RayView
 from raycaster.rendering.raycaster import Raycaster
+from raycaster.rendering.line_of_sight import LineOfSight
+from raycaster.rendering.surface_cache import SurfaceCache
+from raycaster.rendering.shade_table import ShadeTable
+from raycaster.rendering.background_layer import BackgroundLayer
+from raycaster.rendering.wall_compositor import WallCompositor
+from raycaster.rendering.depth_buffer import DepthBuffer
+from raycaster.rendering.render_list import RenderList
+from raycaster.rendering.floor_renderer import FloorRenderer
+from raycaster.rendering.presenter import Presenter
@@ -0,0 +1,61 @@
+import numpy as np
+import pygame
+
+from raycaster import const
+
+
+class BackgroundLayer:
+    """
+    Ceiling and floor gradient rendered once per resolution.
+
+    The gradient never changes during the game, so it is kept as a ready surface and redrawn
+    only when the screen size is changed.
+    """
+
+    CEILING_COLOR = 50
+    FLOOR_COLOR = 30
+
+    def __init__(self):
+        self._size = None
+        self._rows = None
+        self._surface = None
+
+    def _update(self):
+        """
+        Renders the gradient again if the screen size has changed since it was last rendered.
+        """
+        size = const.RENDER_WIDTH, const.RENDER_HEIGHT
+        if size == self._size:
+            return
+        width, height = size
+        half_height = height // 2
+        rows = np.arange(height)
+        shade_factor = (np.abs(rows - half_height) / half_height) ** 2
+        color = np.where(rows < half_height, self.CEILING_COLOR, self.FLOOR_COLOR)
+        self._rows = np.repeat((color * shade_factor).astype(np.uint8)[:, None], 3, 1)
+        self._surface = pygame.surfarray.make_surface(
+            np.broadcast_to(self._rows, (width, height, 3))
+        ).convert()
+        self._size = size
+
+    @property
+    def surface(self) -> pygame.Surface:
+        self._update()
+        return self._surface
+
+    def draw(self, screen: pygame.Surface):
+        """
+        Draws the gradient on the screen.
+
+        :param screen: surface to draw the gradient on
+        """
+        screen.blit(self.surface, (0, 0))
+
+    def render_into(self, framebuffer: np.ndarray):
+        """
+        Writes the gradient into a framebuffer indexed like pygame's surfarray.
+
+        :param framebuffer: RGB pixels with shape (width, height, 3)
+        """
+        self._update()
+        framebuffer[...] = self._rows
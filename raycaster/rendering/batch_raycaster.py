@@ -0,0 +1,207 @@
+import numpy as np
+
+from raycaster.rendering.ray import RayBuffer
+
+EPSILON = 0.0001
+
+
+def skip_steps(clearance: np.ndarray, stride: np.ndarray, cell_size: int) -> np.ndarray:
+    """
+    Calculates how many intersections can be skipped without missing a wall.
+
+    Every skipped intersection stays closer to the current cell than the nearest wall, because
+    one step moves by at most stride / cell_size cells along each axis, plus one cell when
+    crossing a cell border.
+
+    :param clearance: Chebyshev distances in cells from the current cells to the nearest wall
+    :param stride: the larger of the x and y distances between consecutive intersections
+    :param cell_size: size of a single map cell
+    :return: Number of intersections to advance by, at least 1
+    """
+    return np.maximum(1, (clearance - 2) * cell_size // stride)
+
+
+def _trace_intersections(
+    grid: np.ndarray,
+    origin_x: float,
+    origin_y: float,
+    x: np.ndarray,
+    y: np.ndarray,
+    x_step: np.ndarray,
+    y_step: np.ndarray,
+    x_shift: np.ndarray | int,
+    y_shift: np.ndarray | int,
+    active: np.ndarray,
+    cell_size: int,
+    max_distance: float,
+    distance_field: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Steps all rays along one family of grid lines until they hit a wall or run out of range.
+
+    :param grid: Level cells indexed by row and column, 0 means empty
+    :param origin_x: x coordinate the rays are casted from
+    :param origin_y: y coordinate the rays are casted from
+    :param x: x coordinates of the first intersections
+    :param y: y coordinates of the first intersections
+    :param x_step: x distance between consecutive intersections
+    :param y_step: y distance between consecutive intersections
+    :param x_shift: column correction (0 or -1) applied when mapping intersections to cells
+    :param y_shift: row correction (0 or -1) applied when mapping intersections to cells
+    :param active: mask of rays that should be traced
+    :param cell_size: size of a single map cell
+    :param max_distance: maximum distance of a ray
+    :param distance_field: distance from every cell to the nearest wall, enables empty space
+        skipping
+    :return: hit mask, hit distance, hit texture id and hit x, y coordinates
+    """
+    rows, cols = grid.shape
+    ray_count = len(x)
+    hit = np.zeros(ray_count, dtype=bool)
+    distance = np.full(ray_count, np.inf)
+    texture_id = np.zeros(ray_count, dtype=np.uint8)
+    hit_x = np.zeros(ray_count)
+    hit_y = np.zeros(ray_count)
+    active = active.copy()
+    stride = np.maximum(np.abs(x_step), np.abs(y_step))
+    steps = 1
+
+    while active.any():
+        step_distance = np.sqrt((origin_x - x) ** 2 + (origin_y - y) ** 2)
+        map_x = (x // cell_size).astype(np.int64) + x_shift
+        map_y = (y // cell_size).astype(np.int64) + y_shift
+        active &= (
+            (step_distance <= max_distance)
+            & (map_x >= 0)
+            & (map_x <= cols - 1)
+            & (map_y >= 0)
+            & (map_y <= rows - 1)
+        )
+        cells = np.zeros(ray_count, dtype=np.uint8)
+        cells[active] = grid[map_y[active], map_x[active]]
+        step_hit = cells != 0
+
+        hit |= step_hit
+        distance[step_hit] = step_distance[step_hit]
+        texture_id[step_hit] = cells[step_hit]
+        hit_x[step_hit] = x[step_hit]
+        hit_y[step_hit] = y[step_hit]
+
+        active &= ~step_hit
+        if distance_field is not None:
+            clearance = np.zeros(ray_count)
+            clearance[active] = distance_field[map_y[active], map_x[active]]
+            steps = skip_steps(clearance, stride, cell_size)
+        x = x + steps * x_step
+        y = y + steps * y_step
+
+    return hit, distance, texture_id, hit_x, hit_y
+
+
+def cast_rays(
+    grid: np.ndarray,
+    origin_x: float,
+    origin_y: float,
+    cos_a: np.ndarray,
+    sin_a: np.ndarray,
+    fisheye: np.ndarray,
+    cell_size: int,
+    max_distance: float,
+    out: RayBuffer,
+    start: int = 0,
+    distance_field: np.ndarray | None = None,
+) -> RayBuffer:
+    """
+    Casts all rays at once, stepping their grid traversals together.
+
+    Produces the same results as Raycaster.cast_ray called for every ray separately.
+
+    :param grid: Level cells indexed by row and column, 0 means empty
+    :param origin_x: x coordinate the rays are casted from
+    :param origin_y: y coordinate the rays are casted from
+    :param cos_a: cosines of the ray angles
+    :param sin_a: sines of the ray angles
+    :param fisheye: fisheye correction factor of every ray
+    :param cell_size: size of a single map cell
+    :param max_distance: maximum distance of a ray
+    :param out: buffer to store the casted rays in
+    :param start: position of the first ray in the buffer
+    :param distance_field: distance from every cell to the nearest wall, enables empty space
+        skipping
+    :return: Buffer with the casted rays
+    """
+    tan_a = sin_a / np.where(cos_a == 0, EPSILON**2, cos_a)
+
+    up = sin_a > 0
+    right = cos_a < 0
+    all_rays = np.ones(len(cos_a), dtype=bool)
+
+    # Handle near-horizontal angles
+    near_horizontal = np.abs(tan_a) < EPSILON
+    tan_a = np.where(near_horizontal, np.where(tan_a >= 0, EPSILON, -EPSILON), tan_a)
+
+    # Horizontal intersections
+    y_n = -(origin_y - (origin_y // cell_size) * cell_size)
+    y_n = np.where(up, cell_size + y_n, y_n)
+    y_step = np.where(up, cell_size, -cell_size)
+    horizontal = _trace_intersections(
+        grid,
+        origin_x,
+        origin_y,
+        origin_x + y_n / tan_a,
+        origin_y + y_n,
+        y_step / tan_a,
+        y_step,
+        0,
+        np.where(up, 0, -1),
+        all_rays,
+        cell_size,
+        max_distance,
+        distance_field,
+    )
+
+    # Vertical intersections
+    x_n = -(origin_x - (origin_x // cell_size) * cell_size)
+    x_n = np.where(right, x_n, cell_size + x_n)
+    x_step = np.where(right, -cell_size, cell_size)
+    vertical = _trace_intersections(
+        grid,
+        origin_x,
+        origin_y,
+        origin_x + x_n,
+        origin_y + x_n * tan_a,
+        x_step,
+        x_step * tan_a,
+        np.where(right, -1, 0),
+        0,
+        tan_a != 1,
+        cell_size,
+        max_distance,
+        distance_field,
+    )
+
+    h_hit, h_distance, h_texture, h_x, h_y = horizontal
+    v_hit, v_distance, v_texture, v_x, v_y = vertical
+    h_length = np.where(h_hit, h_distance * fisheye, max_distance)
+    v_length = np.where(v_hit, v_distance * fisheye, max_distance)
+
+    is_horizontal = h_length < v_length
+    hit_wall = np.where(is_horizontal, h_hit, v_hit)
+    rays = slice(start, start + len(cos_a))
+    out.x_start = origin_x
+    out.y_start = origin_y
+    out.x_end[rays] = np.where(
+        hit_wall,
+        np.where(is_horizontal, h_x, v_x),
+        origin_x + max_distance * cos_a,
+    )
+    out.y_end[rays] = np.where(
+        hit_wall,
+        np.where(is_horizontal, h_y, v_y),
+        origin_y + max_distance * sin_a,
+    )
+    out.length[rays] = np.where(is_horizontal, h_length, v_length)
+    out.is_horizontal[rays] = is_horizontal
+    out.hit_wall[rays] = hit_wall
+    out.texture_id[rays] = np.where(is_horizontal, h_texture, v_texture)
+    return out
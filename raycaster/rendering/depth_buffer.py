@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+
+from raycaster.rendering.ray import RayBuffer
+from raycaster import const
+
+
+class DepthBuffer:
+    """
+    Distance to the wall seen through every pixel column of the screen.
+
+    Sprites are clipped against it, so they can be drawn after all walls and only the columns
+    in which they are in front of the walls are blitted.
+    """
+
+    def __init__(self):
+        self.depths = np.full(const.RENDER_WIDTH, np.inf)
+
+    def update(self, rays: RayBuffer):
+        """
+        Fills the buffer with the lengths of the rays, pixel columns shared by two screen
+        columns keep the nearer wall.
+
+        :param rays: rays casted for the screen columns
+        """
+        screen_width = const.RENDER_WIDTH
+        if len(self.depths) != screen_width:
+            self.depths = np.empty(screen_width)
+        self.depths.fill(np.inf)
+
+        walls = np.flatnonzero(rays.hit_wall)
+        column_width = math.ceil(const.COLUMN_WIDTH)
+        pixel_x = (
+            (walls * const.COLUMN_WIDTH).astype(np.int64)[:, None]
+            + np.arange(column_width)
+        ).ravel()
+        lengths = np.repeat(rays.length[walls], column_width)
+        inside = pixel_x < screen_width
+        np.minimum.at(self.depths, pixel_x[inside], lengths[inside])
+
+    def visible_spans(
+        self, x_start: int, x_end: int, distance: float
+    ) -> list[tuple[int, int]]:
+        """
+        Finds the runs of pixel columns in which an object is not hidden behind a wall.
+
+        :param x_start: first pixel column of the object on the screen
+        :param x_end: pixel column after the last one of the object
+        :param distance: distance to the object
+        :return: Start and end of every visible run, empty if the object is hidden
+        """
+        x_start, x_end = max(0, x_start), min(len(self.depths), x_end)
+        if x_start >= x_end:
+            return []
+        visible = self.depths[x_start:x_end] >= distance
+        if visible.all():
+            return [(x_start, x_end)]
+        edges = np.flatnonzero(np.diff(visible, prepend=False, append=False))
+        return [
+            (x_start + start, x_start + end)
+            for start, end in zip(edges[::2].tolist(), edges[1::2].tolist())
+        ]
@@ -0,0 +1,210 @@
+from typing import TYPE_CHECKING
+import math
+
+import numpy as np
+import pygame
+
+from raycaster.core import Settings
+from raycaster.game import AssetLoader
+from raycaster.rendering.shade_table import ShadeTable
+from raycaster.utils import calculate_shade_level
+from raycaster import const
+
+if TYPE_CHECKING:
+    from raycaster.game import Map, Player
+    from raycaster.rendering.raycaster import Raycaster
+
+
+class FloorRenderer:
+    """
+    Draws the textured floor and ceiling with NumPy.
+
+    Every screen row below the horizon shows the floor at a single distance, so the world
+    coordinates of all floor pixels are one outer product of the row distances and the
+    directions of the rays. The floor is looked up once per ray into a surface as wide as the
+    ray count, which is then scaled to the width of the screen. The ceiling mirrors the floor
+    above the horizon and shares its coordinates.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        raycaster: "Raycaster",
+        map: "Map",
+        player: "Player",
+    ):
+        self.screen = screen
+        self.raycaster = raycaster
+        self.map = map
+        self.player = player
+        self.settings = Settings()
+        self._texels = None
+        self._tables_key = None
+        texture_size = self.settings.CELL_SIZE * self.settings.CELL_SIZE
+        # Offsets of the first texel of every cell's texture in the texels
+        self._floor_offsets = map.floor_grid.ravel().astype(np.int32) * texture_size
+        self._ceiling_offsets = map.ceiling_grid.ravel().astype(np.int32) * texture_size
+        self._ceiling_mirrors_floor = np.array_equal(map.floor_grid, map.ceiling_grid)
+
+    def _get_texels(self) -> np.ndarray:
+        """
+        Gets the texels of the textures in the pixel format of the screen, converting them on
+        first use.
+        """
+        if self._texels is None:
+            textures = AssetLoader().floor_textures
+            cell_size = self.settings.CELL_SIZE
+            texels = np.zeros((max(textures) + 1, cell_size, cell_size), np.uint32)
+            for texture_id, texture in textures.items():
+                texels[texture_id] = pygame.surfarray.array2d(
+                    texture.convert(self.screen)
+                )
+            self._texels = texels.ravel()
+        return self._texels
+
+    def _update_tables(self):
+        """
+        Recalculates the distances and the shades of the screen rows and the surface the rays
+        are drawn on if the projection has changed.
+        """
+        key = (
+            const.RENDER_WIDTH,
+            const.RENDER_HEIGHT,
+            const.SCREEN_DISTANCE,
+            const.COLUMN_WIDTH,
+            self.settings.MAX_DISTANCE,
+        )
+        if key == self._tables_key:
+            return
+        self._tables_key = key
+
+        # Rows nearer to the horizon than the maximum distance stay black. The floor gets the
+        # extra row of an odd height, the ceiling is one row shorter then.
+        cell_size = self.settings.CELL_SIZE
+        rows = np.arange(const.RENDER_HEIGHT - const.RENDER_HEIGHT // 2) + 0.5
+        distances = const.SCREEN_DISTANCE * cell_size / (2 * rows)
+        shade_levels = np.array(
+            [calculate_shade_level(distance) for distance in distances.tolist()]
+        )
+        self._first_row = (
+            int(np.argmax(shade_levels > 0)) if shade_levels.any() else len(rows)
+        )
+        self._rows = np.arange(self._first_row, len(rows))[:, None]
+        row_count = len(self._rows)
+        self._ceiling_row_count = max(0, const.RENDER_HEIGHT // 2 - self._first_row)
+        self._ray_count = min(
+            math.ceil(const.RENDER_WIDTH / const.COLUMN_WIDTH),
+            self.raycaster.angle_table.column_count,
+        )
+        size = self._ray_count, max(1, row_count)
+        self._ray_frame = pygame.Surface(size, 0, self.screen)
+
+        # The shades of the floor rows, multiplied onto the rows after the texture lookup
+        self._floor_shades = pygame.Surface(size, 0, self.screen)
+        shade_values = np.array(ShadeTable().values)[shade_levels[self._first_row :]]
+        pixels = pygame.surfarray.pixels2d(self._floor_shades)
+        pixels[:, :row_count] = [
+            self._floor_shades.map_rgb((value, value, value))
+            for value in shade_values.tolist()
+        ]
+        del pixels
+        self._ceiling_shades = pygame.transform.flip(self._floor_shades, False, True)
+
+        # Tables of every floor pixel drawn, indexed by row and ray
+        self._pixel_rays = np.tile(
+            np.arange(self._ray_count, dtype=np.int32), row_count
+        )
+        self._pixel_distances = np.repeat(distances[self._first_row :], size[0])
+
+    def draw(self):
+        """
+        Draws the floor and the ceiling on the screen.
+        """
+        texels = self._get_texels()
+        self._update_tables()
+        cell_size = self.settings.CELL_SIZE
+        half_height = const.RENDER_HEIGHT // 2
+        row_count = len(self._rows)
+        self.screen.fill(
+            (0, 0, 0),
+            (0, half_height - self._first_row, const.RENDER_WIDTH, 2 * self._first_row),
+        )
+        if not row_count:
+            return
+
+        # Only the rows below the walls are visible, the walls are drawn over the rest
+        rays = self.raycaster.rays
+        wall_rows = np.where(
+            rays.hit_wall[: self._ray_count],
+            const.SCREEN_DISTANCE * cell_size / (2 * rays.length[: self._ray_count])
+            - 1,
+            0,
+        )
+        # Rows above the lowest wall top are covered by the walls on the whole screen
+        top = min(max(0, math.ceil(wall_rows.min()) - self._first_row), row_count)
+        visible = np.flatnonzero(self._rows[top:] >= wall_rows)
+        visible += top * self._ray_count
+
+        angle_table = self.raycaster.angle_table
+        ray_slice = slice(self._ray_count)
+        cos_a, sin_a = angle_table.directions(self.raycaster.view_angle, ray_slice)
+        distances = np.take(self._pixel_distances, visible)
+        fisheye = angle_table.fisheye[ray_slice]
+        columns = np.take(self._pixel_rays, visible)
+        world_x = self.player.x + distances * np.take(cos_a / fisheye, columns)
+        world_y = self.player.y + distances * np.take(sin_a / fisheye, columns)
+        world_x = np.floor(world_x, out=world_x).astype(np.int32)
+        world_y = np.floor(world_y, out=world_y).astype(np.int32)
+        cell_x = world_x // cell_size
+        cell_y = world_y // cell_size
+        texel_offsets = (world_x - cell_x * cell_size) * cell_size + (
+            world_y - cell_y * cell_size
+        )
+        np.clip(cell_x, 0, self.map.cols - 1, out=cell_x)
+        np.clip(cell_y, 0, self.map.rows - 1, out=cell_y)
+        cells = cell_y * self.map.cols + cell_x
+
+        colors = np.zeros((row_count, self._ray_count), dtype=np.uint32)
+        colors.ravel()[visible] = np.take(
+            texels, texel_offsets + np.take(self._floor_offsets, cells)
+        )
+        self._draw_rows(
+            colors[top:], self._floor_shades, top, half_height + self._first_row + top
+        )
+        if not self._ceiling_mirrors_floor:
+            colors.ravel()[visible] = np.take(
+                texels, texel_offsets + np.take(self._ceiling_offsets, cells)
+            )
+        ceiling_rows = self._ceiling_row_count
+        self._draw_rows(
+            colors[top:ceiling_rows][::-1],
+            self._ceiling_shades,
+            row_count - ceiling_rows,
+            0,
+        )
+
+    def _draw_rows(
+        self, colors: np.ndarray, shades: pygame.Surface, shade_row: int, top: int
+    ):
+        """
+        Shades the colors of the rays, scales them to the width of the screen and draws them.
+
+        :param colors: colors of the rows indexed by row and ray
+        :param shades: shades of the rows
+        :param shade_row: row of the shades of the first row
+        :param top: screen row of the first row
+        """
+        if not len(colors):
+            return
+        pixels = pygame.surfarray.pixels2d(self._ray_frame)
+        pixels[:, : len(colors)] = colors.T
+        del pixels
+        ray_frame = self._ray_frame.subsurface(0, 0, self._ray_count, len(colors))
+        ray_frame.blit(
+            shades,
+            (0, 0),
+            (0, shade_row, self._ray_count, len(colors)),
+            pygame.BLEND_RGB_MULT,
+        )
+        area = pygame.Rect(0, top, const.RENDER_WIDTH, len(colors))
+        pygame.transform.scale(ray_frame, area.size, self.screen.subsurface(area))
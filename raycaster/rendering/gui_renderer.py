@@ -29,6 +29,7 @@ class GuiRenderer:
         self.player = player
         self.map = map
         self.font = AssetLoader().load_doom_font(15)
+        self._cta_backgrounds: dict[pygame.Surface, pygame.Surface] = {}
 
     def _draw_walls_on_minimap(self, surface: pygame.Surface, minimap_scale: float):
         for x, y in self.map.walls:
@@ -57,15 +58,15 @@ class GuiRenderer:
 
     def _draw_rays_on_minimap(self, surface: pygame.Surface, minimap_cell: float):
         rays = self.raycaster.rays
-        for ray in rays:
+        start = rays.x_start / minimap_cell, rays.y_start / minimap_cell
+        x_ends = (rays.x_end / minimap_cell).tolist()
+        y_ends = (rays.y_end / minimap_cell).tolist()
+        for end in zip(x_ends, y_ends):
             pygame.draw.line(
                 surface,
                 (255, 255, 0, 255 * self.settings.MINIMAP_OPACITY_RATIO),
-                (
-                    ray.x_start / minimap_cell,
-                    ray.y_start / minimap_cell,
-                ),
-                (ray.x_end / minimap_cell, ray.y_end / minimap_cell),
+                start,
+                end,
                 1,
             )
 
@@ -155,9 +156,9 @@ class GuiRenderer:
         if not weapon:
             return
         gui_representation = weapon.gui_representation
-        x = self.settings.SCREEN_WIDTH / 2 - gui_representation.get_width() / 2
-        y = self.settings.SCREEN_HEIGHT - gui_representation.get_height()
-        self.screen.blit(gui_representation, (x, y))
+        x = self.settings.SCREEN_WIDTH / 2 - gui_representation.width / 2
+        y = self.settings.SCREEN_HEIGHT - gui_representation.height
+        self.screen.blit(gui_representation.atlas, (x, y), gui_representation.rect)
 
     def draw_hud(self):
         if self.settings.MINIMAP_VISIBLE:
@@ -190,10 +191,13 @@ class GuiRenderer:
         self._draw_center_text("PRESS 'F' TO START", 18 / 20 * self.screen.get_height())
 
     def _draw_cta_background(self, background_image: pygame.Surface):
-        background_image = pygame.transform.scale(
-            background_image, (self.screen.get_width(), self.screen.get_height())
-        )
-        self.screen.blit(background_image, (0, 0))
+        scaled_image = self._cta_backgrounds.get(background_image)
+        if scaled_image is None or scaled_image.get_size() != self.screen.get_size():
+            scaled_image = pygame.transform.scale(
+                background_image, self.screen.get_size()
+            ).convert()
+            self._cta_backgrounds[background_image] = scaled_image
+        self.screen.blit(scaled_image, (0, 0))
 
     def _draw_center_text(self, text: str, row: int):
         text = self.font.render(text, True, WHITE)
@@ -2,12 +2,17 @@ from typing import TYPE_CHECKING
 import pygame
 
 from raycaster.core import Settings
-from raycaster.utils import calculate_shade_factor, shade_surface
+from raycaster.utils import calculate_shade_level
+from raycaster.rendering.shade_table import ShadeTable
 from raycaster.rendering.sprite_projection_processor import SpriteProjectionProcessor
+from raycaster.rendering.surface_cache import SurfaceCache
 
 if TYPE_CHECKING:
     from raycaster.game import Player
+    from raycaster.rendering.depth_buffer import DepthBuffer
+    from raycaster.game.texture_atlas import AtlasFrame
     from raycaster.objects import SpriteObject
+    from raycaster.rendering.sprite_projection_processor import ProjectedSprite
 
 
 class ObjectRenderer:
@@ -18,78 +23,70 @@ class ObjectRenderer:
             cls._instance = super().__new__(cls)
             cls.player = player
             cls.screen = screen
+            cls.shade_table = ShadeTable()
+            cls.sprite_cache = SurfaceCache(Settings().SPRITE_CACHE_SIZE)
         return cls._instance
 
-    def _get_subsurface(
-        self, obj: "SpriteObject", sprite: pygame.Surface
-    ) -> pygame.Surface:
-        """
-        Returns a subsurface of the given sprite based on the spatial dimensions of the object.
-
-        :param obj: Object to calculate subsurface for
-        :param sprite: Sprite to calculate subsurface from
-        :return: Subsurface of the sprite
-        """
-        texture_width, texture_height = obj.texture.get_size()
-        (
-            spatial_width,
-            spatial_height,
-        ) = SpriteProjectionProcessor.get_spatial_dimensions(obj)
-
-        if spatial_width > Settings().SCREEN_WIDTH:
-            x_offset = (
-                (spatial_width - Settings().SCREEN_WIDTH)
-                / spatial_width
-                * texture_width
-            )
-            x_start = x_offset / 2
-            surface_width = texture_width - x_offset
-        else:
-            x_start = 0
-            surface_width = texture_width
-
-        if spatial_height > Settings().SCREEN_HEIGHT:
-            y_offset = (
-                (spatial_height - Settings().SCREEN_HEIGHT)
-                / spatial_height
-                * texture_height
-            )
-            y_start = y_offset / 2
-            surface_height = texture_height - y_offset
-        else:
-            y_start = 0
-            surface_height = texture_height
-
-        return sprite.subsurface(x_start, y_start, surface_width, surface_height)
-
-    def draw(self, obj: "SpriteObject"):
+    def draw(self, obj: "SpriteObject", depth_buffer: "DepthBuffer | None" = None):
         """
         Draws the object on the screen.
 
         :param obj: Object to draw
+        :param depth_buffer: distances to the walls to clip the object against
         """
         if not self._can_be_drawn(obj):
             return
 
-        (
-            spatial_width,
-            spatial_height,
-        ) = SpriteProjectionProcessor.get_spatial_dimensions(obj)
-        sprite = obj.texture.copy()
+        projection = SpriteProjectionProcessor.project(obj)
+        screen_x, screen_y = projection.x, projection.y
+        if depth_buffer is None:
+            spans = [(screen_x, screen_x + projection.width)]
+        else:
+            spans = depth_buffer.visible_spans(
+                screen_x, screen_x + projection.width, projection.depth
+            )
+            if not spans:
+                return
+
+        shade_level = calculate_shade_level(obj.distance) if obj.shaded else None
+        scaled_texture = self.sprite_cache.get(
+            (
+                obj.texture,
+                projection.spatial_width,
+                projection.spatial_height,
+                projection.width,
+                projection.height,
+                shade_level,
+            ),
+            lambda: self._scale_sprite(obj.texture, projection, shade_level),
+        )
+        for start, end in spans:
+            self.screen.blit(
+                scaled_texture,
+                (start, screen_y),
+                (start - screen_x, 0, end - start, projection.height),
+            )
 
-        if obj.shaded:
-            shade_factor = calculate_shade_factor(obj.distance)
-            shade_surface(sprite, shade_factor)
+    def _scale_sprite(
+        self,
+        texture: "AtlasFrame",
+        projection: "ProjectedSprite",
+        shade_level: int | None,
+    ) -> pygame.Surface:
+        """
+        Shades the texture and scales it to the object's size on the screen.
 
-        if not SpriteProjectionProcessor.smaller_than_screen(
-            spatial_width, spatial_height
-        ):
-            sprite = self._get_subsurface(obj, sprite)
+        :param texture: texture of the object
+        :param projection: projection of the object on the screen
+        :param shade_level: shade level of the object, None if it is not shaded
+        :return: Scaled sprite cropped to the screen
+        """
+        sprite = texture.atlas.subsurface(projection.source_rect)
+        if shade_level is not None:
+            sprite = sprite.copy()
+            self.shade_table.shade(sprite, shade_level)
 
-        width, height = SpriteProjectionProcessor.get_screen_dimensions(obj)
-        scaled_texture = pygame.transform.scale(sprite, (width, height))
-        screen_x, screen_y = SpriteProjectionProcessor.get_screen_position(obj)
-        self.screen.blit(scaled_texture, (screen_x, screen_y))
+        return pygame.transform.scale(sprite, (projection.width, projection.height))
 
     def _can_be_drawn(self, obj: "SpriteObject") -> bool:
         """
@@ -99,7 +96,5 @@ class ObjectRenderer:
         :return: True if the object can be drawn, False otherwise
         """
         return (
-            obj.distance <= Settings().MAX_DISTANCE
-            and self.player.in_fov(obj.angle)
-            and obj.distance > 0
+            obj.distance <= Settings().MAX_DISTANCE and obj.in_fov and obj.distance > 0
         )
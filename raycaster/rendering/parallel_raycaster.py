@@ -0,0 +1,226 @@
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from raycaster.rendering.batch_raycaster import cast_rays
+from raycaster.rendering.ray import RayBuffer
+
+# Struct-of-arrays layout shared between the main process and the workers
+GRID_FIELDS = (("cells", np.uint8), ("distance", np.uint8))
+INPUT_FIELDS = (("cos_a", np.float64), ("sin_a", np.float64), ("fisheye", np.float64))
+OUTPUT_FIELDS = (
+    ("x_end", np.float64),
+    ("y_end", np.float64),
+    ("length", np.float64),
+    ("texture_id", np.uint8),
+    ("is_horizontal", np.bool_),
+    ("hit_wall", np.bool_),
+)
+
+_worker_buffers = {}
+
+
+class SharedArrays:
+    """
+    Named arrays of the same length packed into a single shared memory block.
+    """
+
+    def __init__(
+        self,
+        fields: tuple[tuple[str, type], ...],
+        capacity: int,
+        name: str | None = None,
+    ):
+        size = sum(np.dtype(dtype).itemsize for _, dtype in fields) * capacity
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=name is None, size=max(size, 1)
+        )
+        self.arrays = {}
+        offset = 0
+        for field, dtype in fields:
+            self.arrays[field] = np.ndarray(
+                (capacity,), dtype=dtype, buffer=self.shm.buf, offset=offset
+            )
+            offset += np.dtype(dtype).itemsize * capacity
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self, unlink: bool = False):
+        self.arrays.clear()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _attach(
+    role: str, name: str, fields: tuple[tuple[str, type], ...], capacity: int
+) -> dict[str, np.ndarray]:
+    """
+    Attaches a worker to a shared block, reusing the attachment between tasks.
+    """
+    buffers = _worker_buffers.get(role)
+    if buffers is None or buffers.name != name:
+        if buffers is not None:
+            buffers.close()
+        buffers = _worker_buffers[role] = SharedArrays(fields, capacity, name=name)
+    return buffers.arrays
+
+
+def _cast_tile(
+    grid_name: str,
+    grid_shape: tuple[int, int],
+    input_name: str,
+    output_name: str,
+    capacity: int,
+    start: int,
+    stop: int,
+    origin_x: float,
+    origin_y: float,
+    cell_size: int,
+    max_distance: float,
+    skipping: bool,
+):
+    """
+    Casts a tile of columns inside a worker process and writes the results to shared memory.
+    """
+    rows, cols = grid_shape
+    grid = _attach("grid", grid_name, GRID_FIELDS, rows * cols)
+    inputs = _attach("inputs", input_name, INPUT_FIELDS, capacity)
+    outputs = _attach("outputs", output_name, OUTPUT_FIELDS, capacity)
+    tile = slice(start, stop)
+    cast_rays(
+        grid["cells"].reshape(grid_shape),
+        origin_x,
+        origin_y,
+        inputs["cos_a"][tile],
+        inputs["sin_a"][tile],
+        inputs["fisheye"][tile],
+        cell_size,
+        max_distance,
+        RayBuffer.from_arrays(**outputs),
+        start,
+        grid["distance"].reshape(grid_shape) if skipping else None,
+    )
+
+
+class ParallelRaycaster:
+    """
+    Casts tiles of screen columns in a pool of worker processes.
+
+    The map grid and the ray buffers live in shared memory, so only the tile bounds and the
+    ray origin are sent to the workers every frame.
+    """
+
+    def __init__(
+        self,
+        grid: np.ndarray,
+        distance_field: np.ndarray,
+        workers: int,
+        tile_size: int,
+    ):
+        self.tile_size = tile_size
+        self._grid_shape = grid.shape
+        self._grid = SharedArrays(GRID_FIELDS, grid.size)
+        self._grid.arrays["cells"][:] = grid.ravel()
+        self._grid.arrays["distance"][:] = distance_field.ravel()
+        self._inputs = None
+        self._outputs = None
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        atexit.register(self.close)
+
+    def cast(
+        self,
+        origin_x: float,
+        origin_y: float,
+        cos_a: np.ndarray,
+        sin_a: np.ndarray,
+        fisheye: np.ndarray,
+        cell_size: int,
+        max_distance: float,
+        out: RayBuffer,
+        start: int = 0,
+        skipping: bool = False,
+    ) -> RayBuffer:
+        """
+        Casts all rays split into tiles across the worker processes.
+
+        :param origin_x: x coordinate the rays are casted from
+        :param origin_y: y coordinate the rays are casted from
+        :param cos_a: cosines of the ray angles
+        :param sin_a: sines of the ray angles
+        :param fisheye: fisheye correction factor of every ray
+        :param cell_size: size of a single map cell
+        :param max_distance: maximum distance of a ray
+        :param out: buffer to copy the casted rays from the shared ray buffer to
+        :param start: position of the first ray in the buffer
+        :param skipping: whether the workers should jump over empty space
+        :return: Buffer with the casted rays
+        """
+        ray_count = len(cos_a)
+        self._reserve(ray_count)
+        inputs = self._inputs.arrays
+        inputs["cos_a"][:ray_count] = cos_a
+        inputs["sin_a"][:ray_count] = sin_a
+        inputs["fisheye"][:ray_count] = fisheye
+
+        futures = [
+            self._executor.submit(
+                _cast_tile,
+                self._grid.name,
+                self._grid_shape,
+                self._inputs.name,
+                self._outputs.name,
+                self._inputs.capacity,
+                tile_start,
+                min(tile_start + self.tile_size, ray_count),
+                origin_x,
+                origin_y,
+                cell_size,
+                max_distance,
+                skipping,
+            )
+            for tile_start in range(0, ray_count, self.tile_size)
+        ]
+        for future in futures:
+            future.result()
+
+        outputs = self._outputs.arrays
+        out.x_start = origin_x
+        out.y_start = origin_y
+        out.copy_from(
+            RayBuffer.from_arrays(
+                **{field: outputs[field][:ray_count] for field, _ in OUTPUT_FIELDS}
+            ),
+            start,
+        )
+        return out
+
+    def _reserve(self, ray_count: int):
+        """
+        Makes sure the shared ray buffers can hold the given number of rays.
+        """
+        if self._inputs is not None and self._inputs.capacity >= ray_count:
+            return
+        if self._inputs is not None:
+            self._inputs.close(unlink=True)
+            self._outputs.close(unlink=True)
+        self._inputs = SharedArrays(INPUT_FIELDS, ray_count)
+        self._outputs = SharedArrays(OUTPUT_FIELDS, ray_count)
+
+    def close(self):
+        """
+        Stops the workers and releases the shared memory.
+        """
+        if self._executor is None:
+            return
+        self._executor.shutdown()
+        self._executor = None
+        self._grid.close(unlink=True)
+        if self._inputs is not None:
+            self._inputs.close(unlink=True)
+            self._outputs.close(unlink=True)
@@ -0,0 +1,29 @@
+import pygame
+
+
+class Presenter:
+    """
+    Sends the screen to the display when something was drawn since the last frame.
+
+    Screens that do not change, like the start screen, are drawn once and then nothing is sent
+    to the display until something is drawn again. Gameplay redraws the whole screen every
+    frame, so the screen is always sent in full.
+    """
+
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        self._dirty = True
+
+    def mark_dirty(self):
+        """
+        Marks the screen to be sent to the display.
+        """
+        self._dirty = True
+
+    def present(self):
+        """
+        Updates the display, does nothing if nothing has been drawn.
+        """
+        if self._dirty:
+            pygame.display.flip()
+        self._dirty = False
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from raycaster.core import Settings
 
 
@@ -14,3 +16,166 @@ class Ray:
     hit_wall: bool = False
     texture_id: int | None = None
     index: int | None = None
+
+
+class RayBuffer:
+    """
+    Preallocated struct-of-arrays storage for the rays of a whole frame, reused across frames.
+    """
+
+    FIELDS = (
+        ("x_end", np.float64),
+        ("y_end", np.float64),
+        ("length", np.float64),
+        ("texture_id", np.uint8),
+        ("is_horizontal", np.bool_),
+        ("hit_wall", np.bool_),
+        ("index", np.int32),
+    )
+
+    x_end: np.ndarray
+    y_end: np.ndarray
+    length: np.ndarray
+    texture_id: np.ndarray
+    is_horizontal: np.ndarray
+    hit_wall: np.ndarray
+    index: np.ndarray
+
+    def __init__(self, size: int = 0):
+        self.x_start = 0.0
+        self.y_start = 0.0
+        self._size = -1
+        self._capacity = -1
+        self.resize(size)
+
+    @classmethod
+    def from_arrays(cls, **arrays: np.ndarray) -> "RayBuffer":
+        """
+        Creates a buffer backed by the given arrays instead of its own storage.
+
+        :param arrays: array for every field of the buffer, index is optional
+        :return: Ray buffer
+        """
+        buffer = cls.__new__(cls)
+        buffer.x_start = 0.0
+        buffer.y_start = 0.0
+        buffer._size = buffer._capacity = len(arrays["length"])
+        if "index" not in arrays:
+            arrays["index"] = np.arange(buffer._size, dtype=np.int32)
+        for field, _ in cls.FIELDS:
+            setattr(buffer, f"_{field}", arrays[field])
+            setattr(buffer, field, arrays[field])
+        return buffer
+
+    def resize(self, size: int):
+        """
+        Sets the number of rays in the buffer, growing the storage only when needed.
+
+        :param size: number of rays
+        """
+        if size == self._size and size <= self._capacity:
+            return
+        if size > self._capacity:
+            for field, dtype in self.FIELDS:
+                setattr(self, f"_{field}", np.zeros(size, dtype=dtype))
+            self._capacity = size
+            self._index[:] = np.arange(size)
+        self._size = size
+        for field, _ in self.FIELDS:
+            setattr(self, field, getattr(self, f"_{field}")[:size])
+
+    def set(self, index: int, ray: Ray):
+        """
+        Stores a single casted ray in the buffer.
+
+        :param index: position of the ray in the buffer
+        :param ray: casted ray
+        """
+        self.x_end[index] = ray.x_end
+        self.y_end[index] = ray.y_end
+        self.length[index] = ray.length
+        self.texture_id[index] = ray.texture_id or 0
+        self.is_horizontal[index] = ray.is_horizontal
+        self.hit_wall[index] = ray.hit_wall
+
+    def copy_from(self, source: "RayBuffer", start: int = 0):
+        """
+        Copies all rays of another buffer into this one.
+
+        :param source: buffer to copy the rays from
+        :param start: position of the first copied ray in this buffer
+        """
+        rays = slice(start, start + len(source))
+        for field, _ in self.FIELDS:
+            if field != "index":
+                getattr(self, field)[rays] = getattr(source, field)
+
+    def shift(self, offset: int):
+        """
+        Moves the rays by the given number of positions, leaving stale rays at the exposed end.
+
+        :param offset: positive values move rays towards the start of the buffer
+        """
+        for field, _ in self.FIELDS:
+            if field == "index":
+                continue
+            array = getattr(self, field)
+            if offset > 0:
+                array[:-offset] = array[offset:]
+            elif offset < 0:
+                array[-offset:] = array[:offset]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> "RayView":
+        if not -self._size <= index < self._size:
+            raise IndexError("Ray index out of range")
+        return RayView(self, index % self._size)
+
+    def __iter__(self):
+        return (RayView(self, index) for index in range(self._size))
+
+
+class RayView:
+    """
+    Lightweight read-only view of a single ray stored in a RayBuffer.
+    """
+
+    __slots__ = ("_buffer", "index")
+
+    def __init__(self, buffer: RayBuffer, index: int):
+        self._buffer = buffer
+        self.index = index
+
+    @property
+    def x_start(self) -> float:
+        return self._buffer.x_start
+
+    @property
+    def y_start(self) -> float:
+        return self._buffer.y_start
+
+    @property
+    def x_end(self) -> float:
+        return self._buffer.x_end.item(self.index)
+
+    @property
+    def y_end(self) -> float:
+        return self._buffer.y_end.item(self.index)
+
+    @property
+    def length(self) -> float:
+        return self._buffer.length.item(self.index)
+
+    @property
+    def is_horizontal(self) -> bool:
+        return self._buffer.is_horizontal.item(self.index)
+
+    @property
+    def hit_wall(self) -> bool:
+        return self._buffer.hit_wall.item(self.index)
+
+    @property
+    def texture_id(self) -> int | None:
+        return self._buffer.texture_id.item(self.index) if self.hit_wall else None
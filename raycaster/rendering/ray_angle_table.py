@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+
+from raycaster.core import Settings
+
+
+class RayAngleTable:
+    """
+    Per-column ray angles relative to the centre of the view and their trigonometric values.
+    """
+
+    def __init__(self):
+        self.settings = Settings()
+        self._key = None
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        Rebuilds the tables if the field of view or the ray count has changed.
+
+        :return: True if the tables were rebuilt, False otherwise
+        """
+        key = self.settings.FOV, self.settings.RAY_COUNT
+        if key == self._key:
+            return False
+        self._key = key
+
+        fov, ray_count = key
+        self.delta_angle = math.radians(fov / ray_count)
+        columns = np.arange(ray_count + 1)
+        self.offsets = np.radians(columns * math.degrees(self.delta_angle) - fov // 2)
+        self.cos_offsets = np.cos(self.offsets)
+        self.sin_offsets = np.sin(self.offsets)
+        return True
+
+    @property
+    def column_count(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def fisheye(self) -> np.ndarray:
+        """
+        Gets the fisheye correction factor of every column.
+
+        :return: Cosine of the angle between each column's ray and the view direction
+        """
+        return self.cos_offsets
+
+    def directions(
+        self, view_angle: float, columns: slice = slice(None)
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rotates the column offsets by the view angle.
+
+        :param view_angle: viewing direction in radians
+        :param columns: columns to calculate the directions for
+        :return: Cosines and sines of the columns' ray angles
+        """
+        cos_v = math.cos(view_angle)
+        sin_v = math.sin(view_angle)
+        cos_offsets = self.cos_offsets[columns]
+        sin_offsets = self.sin_offsets[columns]
+        return (
+            cos_v * cos_offsets - sin_v * sin_offsets,
+            sin_v * cos_offsets + cos_v * sin_offsets,
+        )
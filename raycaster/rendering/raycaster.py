@@ -1,10 +1,14 @@
 import math
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from raycaster.core import Updatable, Settings
-from raycaster.rendering.ray import Ray
+from raycaster.rendering.ray import Ray, RayBuffer
+from raycaster.rendering.batch_raycaster import cast_rays, EPSILON
+from raycaster.rendering.parallel_raycaster import ParallelRaycaster
+from raycaster.rendering.ray_angle_table import RayAngleTable
 from raycaster.utils import calculate_distance
-from raycaster import const
 
 if TYPE_CHECKING:
     from raycaster.game import Player, Map
@@ -15,54 +19,202 @@ class Raycaster(Updatable):
         self.map = map
         self.player = player
         self.settings = Settings()
-        self._rays = []
+        self.angle_table = RayAngleTable()
+        self._rays = RayBuffer()
+        self._cached_pose = None
+        self._cached_angle_step = 0
+        self._parallel_raycaster = None
+        # Direction the rays were last cast in. It is snapped to the angle between two columns
+        # while the ray cache is enabled, and sprites are projected with it, so that they stay
+        # aligned with the walls.
+        self.view_angle = player.angle
 
     @property
-    def rays(self) -> list[Ray]:
+    def rays(self) -> RayBuffer:
         """
-        Gets the list of rays casted by the raycaster.
+        Gets the buffer of rays casted by the raycaster.
 
-        :return: List of rays
+        :return: Ray buffer, one ray per screen column
         """
         return self._rays
 
     def update(self):
-        player_angle = self.player.angle
-        fov = self.settings.FOV
-        ray_count = self.settings.RAY_COUNT
-        angle_offset = const.DELTA_ANGLE
-        self.rays.clear()
-        for ray_number in range(ray_count + 1):
-            angle = (
-                math.degrees(player_angle)
-                - (fov // 2)
-                + (ray_number * math.degrees(angle_offset))
+        self.angle_table.refresh()
+        column_count = self.angle_table.column_count
+        self._rays.resize(column_count)
+        if not self.settings.RAY_CACHE:
+            self.view_angle = self.player.angle
+            self._cast_columns(self.view_angle, 0, column_count)
+            return
+
+        angle_step = round(self.player.angle / self.angle_table.delta_angle)
+        position_step = self.settings.RAY_CACHE_POSITION_STEP
+        pose = (
+            round(self.player.x / position_step),
+            round(self.player.y / position_step),
+            self.settings.FOV,
+            column_count,
+        )
+        shift = angle_step - self._cached_angle_step
+        if pose == self._cached_pose and shift == 0:
+            return
+
+        self.view_angle = angle_step * self.angle_table.delta_angle
+        if pose == self._cached_pose and abs(shift) < column_count:
+            self._rotate_rays(self.view_angle, shift)
+        else:
+            self._cast_columns(self.view_angle, 0, column_count)
+        self._cached_pose = pose
+        self._cached_angle_step = angle_step
+
+    def _cast_columns(self, view_angle: float, start: int, stop: int):
+        """
+        Casts the rays of the given range of screen columns into the ray buffer.
+
+        :param view_angle: viewing direction in radians
+        :param start: index of the first ray to cast
+        :param stop: index after the last ray to cast
+        """
+        columns = slice(start, stop)
+        cos_a, sin_a = self.angle_table.directions(view_angle, columns)
+        fisheye = self.angle_table.fisheye[columns]
+        if (
+            self.settings.RAYCASTING_WORKERS > 0
+            and stop - start > self.settings.RAYCASTING_TILE_SIZE
+        ):
+            self._get_parallel_raycaster().cast(
+                self.player.x,
+                self.player.y,
+                cos_a,
+                sin_a,
+                fisheye,
+                self.settings.CELL_SIZE,
+                self.settings.MAX_DISTANCE,
+                self._rays,
+                start,
+                self.settings.EMPTY_SPACE_SKIPPING,
+            )
+        elif self.settings.BATCH_RAYCASTING:
+            cast_rays(
+                self.map.grid,
+                self.player.x,
+                self.player.y,
+                cos_a,
+                sin_a,
+                fisheye,
+                self.settings.CELL_SIZE,
+                self.settings.MAX_DISTANCE,
+                self._rays,
+                start,
+                self._get_distance_field(),
             )
-            angle = math.radians(angle) % (2 * math.pi)
-            ray = self.cast_ray(angle)
-            ray.index = ray_number
-            self._rays.append(ray)
+        else:
+            self._rays.x_start = self.player.x
+            self._rays.y_start = self.player.y
+            directions = zip(cos_a.tolist(), sin_a.tolist(), fisheye.tolist())
+            for column, direction in enumerate(directions, start):
+                self._rays.set(column, self._cast_ray(*direction))
 
-    def cast_ray(self, angle: float) -> Ray:
+    def _get_distance_field(self) -> np.ndarray | None:
+        """
+        Gets the map's wall distance field if empty space skipping is enabled.
+
+        :return: Distance field or None
+        """
+        if self.settings.EMPTY_SPACE_SKIPPING:
+            return self.map.distance_field
+        return None
+
+    def _get_parallel_raycaster(self) -> ParallelRaycaster:
+        """
+        Starts the worker pool on first use.
+
+        :return: Parallel raycaster
+        """
+        if self._parallel_raycaster is None:
+            self._parallel_raycaster = ParallelRaycaster(
+                self.map.grid,
+                self.map.distance_field,
+                self.settings.RAYCASTING_WORKERS,
+                self.settings.RAYCASTING_TILE_SIZE,
+            )
+        return self._parallel_raycaster
+
+    def _rotate_rays(self, view_angle: float, shift: int):
+        """
+        Reuses the cached rays after a pure rotation and casts only the newly exposed ones.
+
+        :param view_angle: new viewing direction in radians
+        :param shift: number of columns the view has rotated by
+        """
+        column_count = len(self._rays)
+        self._rays.shift(shift)
+        if shift > 0:
+            kept = slice(0, column_count - shift)
+            self._cast_columns(view_angle, column_count - shift, column_count)
+        else:
+            kept = slice(-shift, column_count)
+            self._cast_columns(view_angle, 0, -shift)
+
+        # Rescale the fisheye correction to the rays' new screen columns
+        fisheye = self.angle_table.fisheye
+        previous = slice(kept.start + shift, kept.stop + shift)
+        length = self._rays.length[kept]
+        hit_wall = self._rays.hit_wall[kept]
+        length[hit_wall] *= fisheye[kept][hit_wall] / fisheye[previous][hit_wall]
+
+    def cast_rays(
+        self, angles: np.ndarray, view_angle: float | None = None
+    ) -> RayBuffer:
+        """
+        Casts rays from the player's position at all given angles at once.
+
+        :param angles: angles in radians from 0 to 2pi
+        :param view_angle: viewing direction for the fisheye correction, player's angle by default
+        :return: Returns information about the casted rays
+        """
+        view_angle = self.player.angle if view_angle is None else view_angle
+        return cast_rays(
+            self.map.grid,
+            self.player.x,
+            self.player.y,
+            np.cos(angles),
+            np.sin(angles),
+            np.cos(angles - view_angle),
+            self.settings.CELL_SIZE,
+            self.settings.MAX_DISTANCE,
+            RayBuffer(len(angles)),
+            distance_field=self._get_distance_field(),
+        )
+
+    def cast_ray(self, angle: float, view_angle: float | None = None) -> Ray:
         """
         Casts a ray from the player's position at the given angle.
 
         :param angle: angle in radians from 0 to 2pi
+        :param view_angle: viewing direction for the fisheye correction, player's angle by default
+        :return: Returns information about the casted ray
+        """
+        view_angle = self.player.angle if view_angle is None else view_angle
+        return self._cast_ray(
+            math.cos(angle), math.sin(angle), math.cos(angle - view_angle)
+        )
+
+    def _cast_ray(self, cos_a: float, sin_a: float, fisheye: float) -> Ray:
+        """
+        Casts a single ray from the player's position in the given direction.
+
+        :param cos_a: cosine of the ray angle
+        :param sin_a: sine of the ray angle
+        :param fisheye: fisheye correction factor of the ray
         :return: Returns information about the casted ray
         """
         cell_size = self.settings.CELL_SIZE
         max_distance = self.settings.MAX_DISTANCE
         player_x, player_y = self.player.x, self.player.y
-        player_angle = self.player.angle
-        angle_diff = angle - player_angle
-        angle_diff = (angle_diff + math.pi) % (
-            2 * math.pi
-        ) - math.pi  # Normalize angle_diff to be within -pi to pi
+        distance_field = self._get_distance_field()
 
-        tan_a = math.tan(angle)
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
-        epsilon = 0.0001
+        tan_a = sin_a / (cos_a if cos_a != 0 else EPSILON**2)
 
         x_max = player_x + max_distance * cos_a
         y_max = player_y + max_distance * sin_a
@@ -71,8 +223,8 @@ class Raycaster(Updatable):
         right = cos_a < 0
 
         # Handle near-horizontal angles
-        if abs(tan_a) < epsilon:
-            tan_a = epsilon if tan_a >= 0 else -epsilon
+        if abs(tan_a) < EPSILON:
+            tan_a = EPSILON if tan_a >= 0 else -EPSILON
 
         # Helper functions
         def _map_coords(x: float, y: float, horizontal: bool = True) -> tuple[int, int]:
@@ -89,6 +241,8 @@ class Raycaster(Updatable):
 
         def _check_intersections(ray: Ray, x: float, y: float, horizontal: bool):
             """Check for intersections with walls."""
+            stride = max(abs(x_step), abs(y_step))
+            steps = 1
             distance = calculate_distance(x, y, player_x, player_y)
             map_x, map_y = _map_coords(x, y, horizontal)
             while distance <= max_distance and not self.map.is_out_of_bounds(
@@ -96,20 +250,24 @@ class Raycaster(Updatable):
             ):
                 if self.map.is_wall(map_x, map_y):
                     ray.hit_wall = True
-                    ray.length = distance * math.cos(angle_diff)
-                    ray.texture_id = self.map.level[map_y][map_x]
+                    ray.length = distance * fisheye
+                    ray.texture_id = self.map.get_texture_id(map_x, map_y)
                     ray.is_horizontal = horizontal
                     ray.x_end = x
                     ray.y_end = y
                     break
 
-                x += x_step
-                y += y_step
+                # Jump over the intersections closer to the cell than the nearest wall
+                if distance_field is not None:
+                    clearance = distance_field.item(map_y, map_x)
+                    steps = max(1, (clearance - 2) * cell_size // stride)
+                x += steps * x_step
+                y += steps * y_step
                 distance = calculate_distance(x, y, player_x, player_y)
                 map_x, map_y = _map_coords(x, y, horizontal)
 
         # Check horizontal intersection
-        horizontal_ray = Ray(player_x, player_y, x_max, y_max)
+        horizontal_ray = Ray(player_x, player_y, x_max, y_max, max_distance)
         if tan_a != 0:
             y_n = -(player_y - (player_y // cell_size) * cell_size)
             y_n = cell_size + y_n if up else y_n
@@ -124,7 +282,7 @@ class Raycaster(Updatable):
             _check_intersections(horizontal_ray, x, y, horizontal=True)
 
         # Check vertical intersection
-        vertical_ray = Ray(player_x, player_y, x_max, y_max)
+        vertical_ray = Ray(player_x, player_y, x_max, y_max, max_distance)
         if tan_a != 1:
             x_n = -(player_x - (player_x // cell_size) * cell_size)
             x_n = cell_size + x_n if not right else x_n
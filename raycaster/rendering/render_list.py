@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING, Iterable
+
+from raycaster.rendering.sprite_projection_processor import SpriteProjectionProcessor
+
+if TYPE_CHECKING:
+    from raycaster.objects import SpriteObject
+
+
+class RenderList:
+    """
+    Sprites kept in drawing order, from the farthest to the nearest, between frames.
+
+    The list follows the sprites passed to every update, which are the sprites in view. Sprites
+    are ordered by their depth along the view direction, the same value they are clipped with
+    against the walls. The sprites and their depths change only a little from one frame to the
+    next, so an insertion sort starting from the previous order has hardly anything to move.
+    """
+
+    def __init__(self):
+        self._sprites: list["SpriteObject"] = []
+
+    def update(self, sprites: Iterable["SpriteObject"]) -> list["SpriteObject"]:
+        """
+        Replaces the sprites in the list, keeping the order of the ones that stay, and sorts them
+        again by their current depths.
+
+        :param sprites: sprites to draw in this frame
+        :return: Sprites from the farthest to the nearest
+        """
+        sprites = list(sprites)
+        current = set(sprites)
+        kept = [sprite for sprite in self._sprites if sprite in current]
+        if len(kept) < len(sprites):
+            known = set(kept)
+            kept.extend(sprite for sprite in sprites if sprite not in known)
+        sprites = self._sprites = kept
+        depths = [SpriteProjectionProcessor.get_depth(sprite) for sprite in sprites]
+
+        for index in range(1, len(sprites)):
+            sprite, depth = sprites[index], depths[index]
+            position = index
+            while position > 0 and depths[position - 1] < depth:
+                sprites[position] = sprites[position - 1]
+                depths[position] = depths[position - 1]
+                position -= 1
+            sprites[position] = sprite
+            depths[position] = depth
+        return sprites
+
+    def __len__(self) -> int:
+        return len(self._sprites)
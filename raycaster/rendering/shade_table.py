@@ -0,0 +1,77 @@
+import numpy as np
+import pygame
+
+from raycaster.core import Settings
+
+
+class ShadeTable:
+    """
+    Shading surfaces of the distance shade levels, created once when the game loads.
+
+    Every level has a tile filled with its color, which is multiplied onto the shaded surfaces
+    instead of allocating and filling a new shading surface for each of them.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls.levels = Settings().SHADE_LEVELS
+            cls.tile_size = Settings().CELL_SIZE
+            cls.values = tuple(
+                int(255 * level / (cls.levels - 1)) for level in range(cls.levels)
+            )
+            cls.tiles = tuple(cls._create_tile(level) for level in range(cls.levels))
+        return cls._instance
+
+    @classmethod
+    def _create_tile(cls, level: int) -> pygame.Surface:
+        """
+        Creates the shading tile of a level.
+        """
+        value = cls.values[level]
+        tile = pygame.Surface((cls.tile_size, cls.tile_size), flags=pygame.SRCALPHA)
+        tile.fill((value, value, value, 255))
+        return tile
+
+    def shade(self, surface: pygame.Surface, level: int):
+        """
+        Shades the surface by darkening it.
+
+        :param surface: Texture surface to be shaded
+        :param level: shade level, 0 being black and the last level keeping the colors
+        """
+        if level >= self.levels - 1:
+            return
+        tile = self.tiles[level]
+        width, height = surface.get_size()
+        for y in range(0, height, self.tile_size):
+            for x in range(0, width, self.tile_size):
+                surface.blit(tile, (x, y), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def shade_textures(
+        self, textures: dict[int, pygame.Surface], surface: pygame.Surface
+    ) -> np.ndarray:
+        """
+        Converts textures of the same size to pixels of every shade level.
+
+        :param textures: textures by id
+        :param surface: surface whose pixel format the texels are packed in
+        :return: Packed pixels indexed by shade level, texture id, x and y
+        """
+        width, height = next(iter(textures.values())).get_size()
+        colors = np.zeros((max(textures) + 1, width, height, 3), dtype=np.uint16)
+        for texture_id, texture in textures.items():
+            colors[texture_id] = pygame.surfarray.array3d(texture)
+
+        values = np.array(self.values, dtype=np.uint16)
+        shaded = (colors * values[:, None, None, None, None] + 255) >> 8
+        losses = surface.get_losses()
+        shifts = surface.get_shifts()
+        texels = np.full(shaded.shape[:-1], surface.get_masks()[3], dtype=np.uint32)
+        for channel in range(3):
+            texels |= (
+                shaded[..., channel].astype(np.uint32) >> losses[channel]
+            ) << shifts[channel]
+        return texels
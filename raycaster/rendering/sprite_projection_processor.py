@@ -1,41 +1,157 @@
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 import math
 
+import pygame
+
 from raycaster.core import Settings
 from raycaster import const
 
 
 if TYPE_CHECKING:
+    from raycaster.game.texture_atlas import AtlasFrame
     from raycaster.objects import SpriteObject
+    from raycaster.rendering.raycaster import Raycaster
+
+
+@dataclass
+class ProjectedSprite:
+    """
+    Projection of an object on the screen, shared by the renderer and the shot checks.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    spatial_width: int
+    spatial_height: int
+    source_rect: pygame.Rect
+    depth: float
 
 
 class SpriteProjectionProcessor:
+    settings = Settings()
+    # Objects are projected in the direction the walls were cast in
+    raycaster: "Raycaster" = None
+    _projections: "WeakKeyDictionary[SpriteObject, tuple[tuple, ProjectedSprite]]" = (
+        WeakKeyDictionary()
+    )
+
     @classmethod
-    def get_screen_position(cls, obj: "SpriteObject") -> tuple[int, int]:
+    def project(cls, obj: "SpriteObject") -> ProjectedSprite:
         """
-        Calculates the position of the object on the screen.
+        Projects the object on the screen. The projection is reused until the object, its
+        current frame, the view direction or the projection constants change, so it is
+        calculated at most once per object per frame.
 
-        :param obj: Object to calculate position for
-        :return: Object's position on the screen
+        :param obj: Object to project
+        :return: Object's projection
         """
-        screen_dist = const.SCREEN_DISTANCE
-        rel_angle = obj.angle - obj.player.angle - math.pi
-        spatial_width, spatial_height = cls.get_spatial_dimensions(obj)
+        key = (
+            obj.distance,
+            obj.angle,
+            cls.raycaster.view_angle,
+            obj.texture,
+            const.SCREEN_DISTANCE,
+        )
+        cached = cls._projections.get(obj)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        projection = cls._project(obj)
+        cls._projections[obj] = key, projection
+        return projection
+
+    @classmethod
+    def _project(cls, obj: "SpriteObject") -> ProjectedSprite:
+        """
+        Calculates the projection of the object on the screen.
+        """
+        # Sizes are rounded, so that objects at similar distances share a scaled sprite
+        size_step = cls.settings.SPRITE_SIZE_STEP
+        spatial_width, spatial_height = (
+            dimension // size_step * size_step
+            for dimension in cls.get_spatial_dimensions(obj)
+        )
+
+        rel_angle = obj.angle - cls.raycaster.view_angle - math.pi
         screen_y = (
-            Settings().SCREEN_HEIGHT // 2 - spatial_height // 2
-            if spatial_height <= Settings().SCREEN_HEIGHT
+            const.RENDER_HEIGHT // 2 - spatial_height // 2
+            if spatial_height <= const.RENDER_HEIGHT
             else 0
         )
         screen_x = (
             (
-                math.tan(rel_angle) * screen_dist
-                + Settings().SCREEN_WIDTH // 2
+                math.tan(rel_angle) * const.SCREEN_DISTANCE
+                + const.RENDER_WIDTH // 2
                 - spatial_width // 2
             )
-            if spatial_width <= Settings().SCREEN_WIDTH
-            else math.tan(rel_angle) * screen_dist
+            if spatial_width <= const.RENDER_WIDTH
+            else math.tan(rel_angle) * const.SCREEN_DISTANCE
         )
-        return int(screen_x), int(screen_y)
+        return ProjectedSprite(
+            x=int(screen_x),
+            y=int(screen_y),
+            width=min(spatial_width, const.RENDER_WIDTH),
+            height=min(spatial_height, const.RENDER_HEIGHT),
+            spatial_width=spatial_width,
+            spatial_height=spatial_height,
+            source_rect=cls._get_source_rect(
+                obj.texture, spatial_width, spatial_height
+            ),
+            depth=cls.get_depth(obj),
+        )
+
+    @staticmethod
+    def _get_source_rect(
+        texture: "AtlasFrame", spatial_width: int, spatial_height: int
+    ) -> pygame.Rect:
+        """
+        Calculates the part of the texture that fits on the screen.
+
+        :param texture: texture of the object
+        :param spatial_width: width of the object on the screen before cropping
+        :param spatial_height: height of the object on the screen before cropping
+        :return: Visible part of the texture in its atlas
+        """
+        texture_width, texture_height = texture.size
+
+        if spatial_width > const.RENDER_WIDTH:
+            x_offset = (
+                (spatial_width - const.RENDER_WIDTH) / spatial_width * texture_width
+            )
+            x_start = x_offset / 2
+            surface_width = texture_width - x_offset
+        else:
+            x_start = 0
+            surface_width = texture_width
+
+        if spatial_height > const.RENDER_HEIGHT:
+            y_offset = (
+                (spatial_height - const.RENDER_HEIGHT) / spatial_height * texture_height
+            )
+            y_start = y_offset / 2
+            surface_height = texture_height - y_offset
+        else:
+            y_start = 0
+            surface_height = texture_height
+
+        return pygame.Rect(x_start, y_start, surface_width, surface_height).move(
+            texture.rect.topleft
+        )
+
+    @classmethod
+    def get_screen_position(cls, obj: "SpriteObject") -> tuple[int, int]:
+        """
+        Calculates the position of the object on the screen.
+
+        :param obj: Object to calculate position for
+        :return: Object's position on the screen
+        """
+        projection = cls.project(obj)
+        return projection.x, projection.y
 
     @classmethod
     def get_screen_dimensions(cls, obj: "SpriteObject") -> tuple[int, int]:
@@ -45,11 +161,19 @@ class SpriteProjectionProcessor:
         :param obj: Object to calculate size for
         :return: Object's size on the screen
         """
-        spatial_width, spatial_height = cls.get_spatial_dimensions(obj)
-        if cls.smaller_than_screen(spatial_width, spatial_height):
-            return (spatial_width, spatial_height)
-        else:
-            return cls._scale_dimensions(spatial_width, spatial_height)
+        projection = cls.project(obj)
+        return projection.width, projection.height
+
+    @classmethod
+    def get_depth(cls, obj: "SpriteObject") -> float:
+        """
+        Calculates the distance to the object along the view direction, which is how the ray
+        lengths are measured after the fisheye correction.
+
+        :param obj: Object to calculate depth for
+        :return: Object's depth
+        """
+        return obj.distance * math.cos(obj.angle - cls.raycaster.view_angle)
 
     @staticmethod
     def get_spatial_dimensions(obj: "SpriteObject") -> tuple[int, int]:
@@ -60,7 +184,7 @@ class SpriteProjectionProcessor:
         :return: Object's spatial dimensions
         """
         screen_dist = const.SCREEN_DISTANCE
-        texture_width, texture_height = obj.texture.get_size()
+        texture_width, texture_height = obj.texture.size
         height = screen_dist * texture_height / obj.distance
         width = screen_dist * texture_width / obj.distance
         return int(width), int(height)
@@ -70,27 +194,17 @@ class SpriteProjectionProcessor:
         """
         Checks if the dimensions are smaller than the screen.
         """
-        return height <= Settings().SCREEN_HEIGHT and width <= Settings().SCREEN_WIDTH
+        return height <= const.RENDER_HEIGHT and width <= const.RENDER_WIDTH
 
     @classmethod
     def intersects_screen_center(cls, obj: "SpriteObject") -> bool:
         """
         Checks if the object's screen projection intersects the center of the screen.
         """
-        screen_x, screen_y = cls.get_screen_position(obj)
-        screen_width, screen_height = cls.get_screen_dimensions(obj)
+        projection = cls.project(obj)
         return (
-            screen_x <= Settings().SCREEN_WIDTH // 2 <= screen_x + screen_width
-            and screen_y <= Settings().SCREEN_HEIGHT // 2 <= screen_y + screen_height
+            projection.x <= const.RENDER_WIDTH // 2 <= projection.x + projection.width
+            and projection.y
+            <= const.RENDER_HEIGHT // 2
+            <= projection.y + projection.height
         )
-
-    @staticmethod
-    def _scale_dimensions(width: int | float, height: int | float) -> tuple[int, int]:
-        """
-        Returns the scaled dimensions of the object based on the spatial dimensions.
-        """
-        width = Settings().SCREEN_WIDTH if width > Settings().SCREEN_WIDTH else width
-        height = (
-            Settings().SCREEN_HEIGHT if height > Settings().SCREEN_HEIGHT else height
-        )
-        return int(width), int(height)
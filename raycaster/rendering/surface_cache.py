@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+
+class SurfaceCache:
+    """
+    Least recently used cache of surfaces, bounded by the memory taken by their pixels.
+
+    Surfaces larger than a quarter of the cache are created but not stored, so a single large
+    surface does not evict everything else.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+
+    def get(
+        self, key: Hashable, create: Callable[[], pygame.Surface]
+    ) -> pygame.Surface:
+        """
+        Gets the surface stored under the key, creating and storing it on a miss.
+
+        :param key: key identifying the surface
+        :param create: function creating the surface
+        :return: Cached or newly created surface
+        """
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = create()
+        surface_bytes = surface.get_pitch() * surface.get_height()
+        if surface_bytes > self.max_bytes // 4:
+            return surface
+        while self._entries and self.size_bytes + surface_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        self._entries[key] = surface
+        self.size_bytes += surface_bytes
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Gets the share of lookups served from the cache.
+
+        :return: Hit rate from 0 to 1
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "surfaces": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        """
+        Removes all surfaces, keeping the counters.
+        """
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
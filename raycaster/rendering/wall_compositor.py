@@ -0,0 +1,134 @@
+import math
+
+import numpy as np
+import pygame
+
+from raycaster.core import Settings
+from raycaster.game import AssetLoader
+from raycaster.rendering.ray import RayBuffer
+from raycaster.rendering.shade_table import ShadeTable
+from raycaster import const
+
+
+class WallCompositor:
+    """
+    Draws the walls of many screen columns at once with NumPy.
+
+    The wall textures are kept as arrays of screen pixels, one copy for every shade level, and
+    the texel of every pixel of the drawn columns is looked up in a single vectorized pass. The
+    result is the same as scaling, shading and blitting every column separately.
+    """
+
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        self.settings = Settings()
+        self._texels = None
+        self._texture_count = 0
+
+    def _get_texels(self) -> np.ndarray:
+        """
+        Gets the shaded texels of all wall textures, converting them on first use.
+
+        :return: Flat array of screen pixels indexed by shade level, texture id, x and y
+        """
+        if self._texels is not None:
+            return self._texels
+
+        texels = ShadeTable().shade_textures(AssetLoader().wall_textures, self.screen)
+        self._texture_count = texels.shape[1]
+        self._texels = texels.ravel()
+        return self._texels
+
+    def draw(self, rays: RayBuffer, indices: np.ndarray | None = None):
+        """
+        Draws the walls hit by the rays on the screen.
+
+        :param rays: rays casted for the screen columns
+        :param indices: positions of the rays to draw, all rays that hit a wall by default
+        """
+        if indices is None:
+            indices = np.flatnonzero(rays.hit_wall)
+        else:
+            indices = indices[rays.hit_wall[indices]]
+        if not len(indices):
+            return
+
+        texels = self._get_texels()
+        screen_height = const.RENDER_HEIGHT
+        cell_size = self.settings.CELL_SIZE
+
+        lengths = rays.length[indices]
+        pixel_x, owners = self._assign_pixels(indices, lengths)
+        if not len(pixel_x):
+            return
+        heights = const.SCREEN_DISTANCE * cell_size / lengths
+        x_offsets = np.where(
+            rays.is_horizontal[indices],
+            rays.x_end[indices] % cell_size,
+            rays.y_end[indices] % cell_size,
+        ).astype(np.int64)
+        columns = (
+            self._shade_levels(lengths) * self._texture_count + rays.texture_id[indices]
+        ) * cell_size + x_offsets
+
+        # Walls taller than the screen show only the middle part of the texture
+        y_starts = np.maximum(0, screen_height / 2 - heights / 2).astype(np.int32)
+        drawn_heights = np.minimum(heights.astype(np.int32), screen_height)
+        y_offsets = np.maximum(0, heights - screen_height) / heights * cell_size
+        texture_tops = (y_offsets / 2).astype(np.int32)
+        texture_heights = np.maximum(1, cell_size - y_offsets).astype(np.int32)
+
+        top, bottom = y_starts.min(), (y_starts + drawn_heights).max()
+        rows = np.arange(top, bottom, dtype=np.int32)[:, None] - y_starts
+        visible = (rows >= 0) & (rows < drawn_heights)
+        # Same integer row mapping as pygame.transform.scale
+        texture_rows = texture_tops + np.maximum(rows, 0) * texture_heights // (
+            drawn_heights
+        )
+        colors = texels[columns * cell_size + texture_rows]
+
+        frame = pygame.surfarray.pixels2d(self.screen).T[top:bottom]
+        if pixel_x[-1] - pixel_x[0] + 1 == len(pixel_x):
+            np.copyto(
+                frame[:, pixel_x[0] : pixel_x[-1] + 1],
+                colors[:, owners],
+                where=visible[:, owners],
+            )
+        else:
+            frame[:, pixel_x] = np.where(
+                visible[:, owners], colors[:, owners], frame[:, pixel_x]
+            )
+
+    def _assign_pixels(
+        self, indices: np.ndarray, lengths: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the screen pixel columns of the rays, giving pixels shared by two neighbouring
+        columns to the nearer wall.
+
+        :return: Sorted x coordinates of the pixels and the positions of their rays in indices
+        """
+        column_width = math.ceil(const.COLUMN_WIDTH)
+        pixel_x = (
+            (indices * const.COLUMN_WIDTH).astype(np.int64)[:, None]
+            + np.arange(column_width)
+        ).ravel()
+        owners = np.repeat(np.arange(len(indices)), column_width)
+        order = np.lexsort((lengths[owners], pixel_x))
+        pixel_x, owners = pixel_x[order], owners[order]
+        kept = np.ones(len(pixel_x), dtype=bool)
+        kept[1:] = pixel_x[1:] != pixel_x[:-1]
+        kept &= pixel_x < const.RENDER_WIDTH
+        return pixel_x[kept], owners[kept]
+
+    def _shade_levels(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Calculates the shade level of walls from their distances like calculate_shade_level.
+        """
+        max_distance = self.settings.MAX_DISTANCE
+        shade_factors = np.where(
+            distances <= max_distance, (max_distance - distances) / max_distance, 0
+        )
+        return np.round(shade_factors * (self.settings.SHADE_LEVELS - 1)).astype(
+            np.int64
+        )
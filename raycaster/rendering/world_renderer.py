@@ -1,13 +1,21 @@
 import math
 from typing import TYPE_CHECKING
+import numpy as np
 import pygame
 
 from raycaster.core import Drawable, Settings
 from raycaster.game import AssetLoader
-from raycaster.objects import ObjectManager, SpriteObject
+from raycaster.objects import ObjectManager, SpatialIndex
+from raycaster.objects.weapons import Weapon
+from raycaster.rendering.background_layer import BackgroundLayer
+from raycaster.rendering.depth_buffer import DepthBuffer
+from raycaster.rendering.floor_renderer import FloorRenderer
 from raycaster.rendering.object_renderer import ObjectRenderer
-from raycaster.utils import calculate_shade_factor, shade_surface
-from raycaster.rendering.ray import Ray
+from raycaster.utils import calculate_shade_level
+from raycaster.rendering.ray import Ray, RayView
+from raycaster.rendering.render_list import RenderList
+from raycaster.rendering.shade_table import ShadeTable
+from raycaster.rendering.wall_compositor import WallCompositor
 from raycaster import const
 
 
@@ -25,55 +33,60 @@ class WorldRenderer(Drawable):
         player: "Player",
     ):
         self.screen = screen
+        self.frame = self._create_frame()
         self.raycaster = raycaster
         self.player = player
         self.settings = Settings()
         self.wall_textures = AssetLoader().wall_textures
+        self.wall_columns = AssetLoader().wall_columns
+        self.shade_table = ShadeTable()
+        self.background = BackgroundLayer()
+        self.floor_renderer = FloorRenderer(self.frame, raycaster, map, player)
+        self.wall_compositor = WallCompositor(self.frame)
+        self.depth_buffer = DepthBuffer()
         self.object_manager = ObjectManager(player, raycaster, map)
+        self.object_renderer = ObjectRenderer(screen=self.frame, player=player)
+        self.spatial_index = SpatialIndex()
+        self.render_list = RenderList()
         self.map = map
 
+    def _create_frame(self) -> pygame.Surface:
+        """
+        Creates the surface the world is drawn on, which is scaled up to the screen unless the
+        render resolution matches it.
+
+        :return: Frame of the render resolution
+        """
+        if self.screen.get_size() == const.RENDER_RESOLUTION:
+            return self.screen
+        return pygame.Surface(const.RENDER_RESOLUTION, 0, self.screen)
+
+    def _update_frame(self):
+        """
+        Recreates the frame after the render scale has changed.
+        """
+        if self.frame.get_size() == const.RENDER_RESOLUTION:
+            return
+        self.frame = self._create_frame()
+        self.floor_renderer.screen = self.frame
+        self.wall_compositor.screen = self.frame
+        self.object_renderer.screen = self.frame
+
     def _draw_background(self):
         """
-        Draws the background with gradient shading in the centre.
+        Draws the background with gradient shading in the centre, or the textured floor and
+        ceiling.
         """
-        for row in range(self.settings.SCREEN_HEIGHT // 2):
-            shade_factor = (
-                (self.settings.SCREEN_HEIGHT // 2 - row)
-                / (self.settings.SCREEN_HEIGHT // 2)
-            ) ** 2
-            pygame.draw.line(
-                self.screen,
-                (
-                    int(50) * shade_factor,
-                    int(50) * shade_factor,
-                    int(50) * shade_factor,
-                ),
-                (0, row),
-                (self.settings.SCREEN_WIDTH, row),
-                1,
-            )
-        for row in range(self.settings.SCREEN_HEIGHT // 2, self.settings.SCREEN_HEIGHT):
-            shade_factor = (
-                (row - self.settings.SCREEN_HEIGHT // 2)
-                / (self.settings.SCREEN_HEIGHT // 2)
-            ) ** 2
-            pygame.draw.line(
-                self.screen,
-                (
-                    int(30) * shade_factor,
-                    int(30) * shade_factor,
-                    int(30) * shade_factor,
-                ),
-                (0, row),
-                (self.settings.SCREEN_WIDTH, row),
-                1,
-            )
+        if self.settings.TEXTURED_FLOOR:
+            self.floor_renderer.draw()
+        else:
+            self.background.draw(self.frame)
 
-    def _draw_wall(self, ray: "Ray"):
+    def _draw_wall(self, ray: Ray | RayView):
         """
         Draws a wall on the screen.
 
-        :param ray: Ray dataclass instance
+        :param ray: Ray casted for the wall's screen column
         :param ray_number: number of the ray
         """
         if not ray.hit_wall:
@@ -81,68 +94,76 @@ class WorldRenderer(Drawable):
         if ray.texture_id not in self.wall_textures:
             raise ValueError(f"Wall texture with id {ray.texture_id} not found")
 
-        screen_dist = const.SCREEN_DISTANCE
-        ray_count = self.settings.RAY_COUNT
-        column_width = math.ceil(self.settings.SCREEN_WIDTH / ray_count)
-
-        wall_texture = self.wall_textures[ray.texture_id]
-
-        height = screen_dist * self.settings.CELL_SIZE / ray.length
+        height = const.SCREEN_DISTANCE * self.settings.CELL_SIZE / ray.length
         x_offset = (
             (ray.x_end % self.settings.CELL_SIZE)
             if ray.is_horizontal
             else (ray.y_end % self.settings.CELL_SIZE)
         )
-        texture_height = wall_texture.get_height()
+        shade_level = calculate_shade_level(ray.length)
 
-        if height <= self.settings.SCREEN_HEIGHT:
-            column = wall_texture.subsurface(x_offset, 0, 1, texture_height)
-            column = pygame.transform.scale(column, (column_width, height))
-            y_pos = self.settings.SCREEN_HEIGHT / 2 - height / 2
-        else:
-            y_offset = height - self.settings.SCREEN_HEIGHT
+        texture_column = self.wall_columns[ray.texture_id][int(x_offset)]
+        column = self._scale_wall_column(texture_column, height, shade_level)
+        x_pos = int(ray.index * const.COLUMN_WIDTH)
+        y_pos = max(0, const.RENDER_HEIGHT / 2 - height / 2)
+        self.frame.blit(column, (x_pos, y_pos))
+
+    def _scale_wall_column(
+        self, texture_column: pygame.Surface, height: float, shade_level: int
+    ) -> pygame.Surface:
+        """
+        Scales a texture column to the wall's height on the screen and shades it.
+
+        :param texture_column: 1 pixel wide column of the wall texture
+        :param height: height of the wall on the screen
+        :param shade_level: shade level of the wall
+        :return: Screen column cropped to the screen height
+        """
+        if height > const.RENDER_HEIGHT:
+            y_offset = height - const.RENDER_HEIGHT
             y_offset = y_offset / height * self.settings.CELL_SIZE
-            column = wall_texture.subsurface(
-                x_offset, y_offset / 2, 1, self.settings.CELL_SIZE - y_offset
+            # At least one texel row is kept when the wall is right in front of the player
+            texture_column = texture_column.subsurface(
+                0, y_offset / 2, 1, max(1, self.settings.CELL_SIZE - y_offset)
             )
-            column = pygame.transform.scale(
-                column, (column_width, self.settings.SCREEN_HEIGHT)
-            )
-            y_pos = 0
-
-        shade = calculate_shade_factor(ray.length)
-        shade_surface(column, shade)
-        x_pos = ray.index * column_width
-        self.screen.blit(column, (x_pos, y_pos))
+        column = pygame.transform.scale(
+            texture_column,
+            (math.ceil(const.COLUMN_WIDTH), min(int(height), const.RENDER_HEIGHT)),
+        )
+        self.shade_table.shade(column, shade_level)
+        return column
 
     def _draw_world(self):
-        object_renderer = ObjectRenderer(screen=self.screen, player=self.player)
-        object_manager = ObjectManager(
-            player=self.player, raycaster=self.raycaster, map=self.map
-        )
-        objects = [
-            *[ray for ray in self.raycaster.rays if ray.hit_wall],
-            *self.object_manager.objects,
-            *self.object_manager.enemies,
-            *[weapon for weapon in self.object_manager.weapons if not weapon.equipped],
-        ]
-        objects.sort(
-            key=lambda obj: obj.distance
-            if isinstance(obj, SpriteObject)
-            else obj.length,
-            reverse=True,
+        rays = self.raycaster.rays
+        self.depth_buffer.update(rays)
+        if self.settings.WALL_COMPOSITOR:
+            self.wall_compositor.draw(rays)
+        else:
+            # Walls sharing a pixel column are drawn back to front, so the nearer one stays
+            walls = np.flatnonzero(rays.hit_wall)
+            walls = walls[np.argsort(-rays.length[walls], kind="stable")]
+            for index in walls.tolist():
+                self._draw_wall(rays[index])
+
+        sprites = self.spatial_index.query_view_cone(
+            self.player.x,
+            self.player.y,
+            self.raycaster.view_angle,
+            math.radians(self.settings.FOV),
+            self.settings.MAX_DISTANCE,
         )
-
-        for obj in objects:
-            if isinstance(obj, Ray):
-                self._draw_wall(obj)
-            else:
-                object_renderer.draw(obj)
+        for sprite in self.render_list.update(sprites):
+            # The equipped weapon is drawn by the HUD instead
+            if not (isinstance(sprite, Weapon) and sprite.equipped):
+                self.object_renderer.draw(sprite, self.depth_buffer)
 
     def draw(self):
         """
         TODO: Find out why sometimes(very often) screen turns black when player run into wall and fix this.
         (objection: isn't it because of the player's falling into the wall? perhaps we should check wall hitbox)
         """
+        self._update_frame()
         self._draw_background()
         self._draw_world()
+        if self.frame is not self.screen:
+            pygame.transform.scale(self.frame, self.screen.get_size(), self.screen)
@@ -1,7 +1,7 @@
 import math
 import pygame
 
-from raycaster.core import Settings
+from raycaster.core import Settings, SimulationClock
 
 
 def calculate_distance(start_x, start_y, end_x, end_y) -> float:
@@ -17,6 +17,17 @@ def calculate_distance(start_x, start_y, end_x, end_y) -> float:
     return math.sqrt((end_x - start_x) ** 2 + (end_y - start_y) ** 2)
 
 
+def get_ticks() -> int:
+    """
+    Gets the game time, taken from the simulation clock if one is installed.
+
+    :return: Number of milliseconds since the game started
+    """
+    if SimulationClock.active is not None:
+        return SimulationClock.active.get_ticks()
+    return pygame.time.get_ticks()
+
+
 def calculate_shade_factor(distance: float) -> float:
     """
     Calculates the shade of the color based on the distance.
@@ -31,19 +42,11 @@ def calculate_shade_factor(distance: float) -> float:
     return 0
 
 
-def shade_surface(surface: pygame.Surface, shade_factor: float):
+def calculate_shade_level(distance: float) -> int:
     """
-    Shades the surface by darkening it.
+    Calculates the shade level of the color based on the distance.
 
-    :param surface: Texture surface to be shaded.
-    :param shade_factor: Factor to shade the surface with, ranging from 0 to 1.
+    :param distance: length of the ray
+    :return: index of the shade level, 0 being the darkest
     """
-    shading_surface = pygame.Surface(surface.get_size(), flags=pygame.SRCALPHA)
-    shade_color = (
-        int(255 * shade_factor),
-        int(255 * shade_factor),
-        int(255 * shade_factor),
-        255,
-    )
-    shading_surface.fill(shade_color)
-    surface.blit(shading_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return round(calculate_shade_factor(distance) * (Settings().SHADE_LEVELS - 1))
@@ -0,0 +1,72 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+from raycaster import const
+from raycaster.core import Settings
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """
+    Changes settings for a single test and recalculates the projection constants.
+    """
+
+    def configure(**settings):
+        for name, value in settings.items():
+            monkeypatch.setattr(Settings, name, value)
+        const.refresh_projection_constants()
+
+    yield configure
+    monkeypatch.undo()
+    const.refresh_projection_constants()
+
+
+@pytest.fixture(scope="session")
+def game():
+    from raycaster.game import Game
+
+    return Game()
+
+
+def random_poses(
+    level: list[list[int]], count: int, seed: int = 0
+) -> list[tuple[float, float, float]]:
+    """
+    Picks random positions in empty cells of the level and random view angles.
+    """
+    rng = random.Random(seed)
+    cell_size = Settings.CELL_SIZE
+    empty = [
+        (x, y) for y, row in enumerate(level) for x, cell in enumerate(row) if not cell
+    ]
+    poses = []
+    for _ in range(count):
+        x, y = rng.choice(empty)
+        poses.append(
+            (
+                (x + rng.random()) * cell_size,
+                (y + rng.random()) * cell_size,
+                rng.uniform(0, 6.28),
+            )
+        )
+    return poses
+
+
+def open_level(size: int, obstacle_count: int, seed: int = 0) -> list[list[int]]:
+    """
+    Builds a walled square level with scattered single-cell obstacles, where long stretches of
+    empty space let the raycasters and the line of sight queries skip ahead.
+    """
+    rng = random.Random(seed)
+    level = [[1] * size] + [[1] + [0] * (size - 2) + [1] for _ in range(size - 2)]
+    level.append([1] * size)
+    for _ in range(obstacle_count):
+        level[rng.randrange(1, size - 1)][rng.randrange(1, size - 1)] = rng.choice(
+            [2, 3]
+        )
+    return level
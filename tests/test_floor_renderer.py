@@ -0,0 +1,33 @@
+import pygame
+import pytest
+
+from raycaster import const
+
+from conftest import random_poses
+
+MAGENTA = (255, 0, 255)
+
+
+@pytest.mark.parametrize("wall_compositor", [False, True])
+@pytest.mark.parametrize("render_scale", [0.55, 0.73, 1.0])
+def test_textured_floor_covers_the_frame(
+    game, configure, wall_compositor, render_scale
+):
+    configure(
+        TEXTURED_FLOOR=True,
+        WALL_COMPOSITOR=wall_compositor,
+        RENDER_SCALE=render_scale,
+    )
+    renderer = game.renderer
+    for x, y, angle in random_poses(game.map.level, 10):
+        game.player.x, game.player.y, game.player.angle = x, y, angle
+        game.raycaster.update()
+        renderer._update_frame()
+        renderer.frame.fill(MAGENTA)
+        renderer.draw()
+
+        assert renderer.frame.get_size() == const.RENDER_RESOLUTION
+        magenta = renderer.frame.map_rgb(MAGENTA)
+        pixels = pygame.surfarray.pixels2d(renderer.frame)
+        assert not (pixels == magenta).any()
+        del pixels
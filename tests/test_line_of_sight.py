@@ -0,0 +1,125 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from raycaster.core import Settings
+from raycaster.game import Map
+from raycaster.rendering import LineOfSight
+
+from conftest import open_level, random_poses
+
+
+def random_pairs(
+    level: list[list[int]], count: int, seed: int = 0
+) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """
+    Picks random pairs of points in empty cells of the level.
+    """
+    points = [(x, y) for x, y, _ in random_poses(level, 2 * count, seed)]
+    return list(zip(points[::2], points[1::2]))
+
+
+def nearby_pairs(
+    map: Map, count: int, max_offset: float, seed: int = 0
+) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """
+    Picks random points in empty cells of the map, each paired with an empty point at most
+    max_offset cells away along both axes.
+    """
+    rng = random.Random(seed)
+    cell_size = Settings.CELL_SIZE
+    pairs = []
+    for x, y, _ in random_poses(map.level, count, seed):
+        target = (
+            x + rng.uniform(-max_offset, max_offset) * cell_size,
+            y + rng.uniform(-max_offset, max_offset) * cell_size,
+        )
+        cell = math.floor(target[0] / cell_size), math.floor(target[1] / cell_size)
+        if not map.is_out_of_bounds(*cell) and not map.is_wall(*cell):
+            pairs.append(((x, y), target))
+    return pairs
+
+
+def sampled_los(
+    map: Map, from_xy: tuple[float, float], to_xy: tuple[float, float]
+) -> bool:
+    """
+    Checks for walls by sampling many points along the line between two points.
+    """
+    cell_size = Settings.CELL_SIZE
+    start = math.floor(from_xy[0] / cell_size), math.floor(from_xy[1] / cell_size)
+    end = math.floor(to_xy[0] / cell_size), math.floor(to_xy[1] / cell_size)
+    samples = int(math.dist(from_xy, to_xy) / cell_size * 1000) + 2
+    for t in np.linspace(0, 1, samples).tolist():
+        cell = (
+            math.floor((from_xy[0] + t * (to_xy[0] - from_xy[0])) / cell_size),
+            math.floor((from_xy[1] + t * (to_xy[1] - from_xy[1])) / cell_size),
+        )
+        # The observer's and the target's cells are never blocking
+        if cell not in (start, end) and map.is_wall(*cell):
+            return False
+    return True
+
+
+def test_single_and_batched_queries_match_sampling():
+    map = Map()
+    line_of_sight = LineOfSight(map)
+    pairs = random_pairs(map.level, 300)
+    # Lines along the grid axes and zero length lines
+    cell_size = Settings.CELL_SIZE
+    pairs += [
+        (from_xy, target)
+        for from_xy, to_xy in pairs[:100]
+        for target in ((to_xy[0], from_xy[1]), (from_xy[0], to_xy[1]), from_xy)
+        if not map.is_wall(int(target[0] // cell_size), int(target[1] // cell_size))
+    ]
+
+    expected = [sampled_los(map, from_xy, to_xy) for from_xy, to_xy in pairs]
+    single = [line_of_sight.has_los(from_xy, to_xy) for from_xy, to_xy in pairs]
+    batched = line_of_sight.has_los_many(
+        [from_xy for from_xy, _ in pairs], [to_xy for _, to_xy in pairs]
+    )
+
+    assert single == expected
+    assert batched.tolist() == expected
+    # Both outcomes are covered
+    assert 0 < sum(expected) < len(expected)
+
+
+def test_area_check_never_misses_walls():
+    map = Map(open_level(64, 20))
+    grid = np.array(map.level)
+    rng = random.Random(0)
+    for _ in range(2000):
+        x_min, x_max = sorted(rng.randrange(64) for _ in range(2))
+        y_min, y_max = sorted(rng.randrange(64) for _ in range(2))
+        if grid[y_min : y_max + 1, x_min : x_max + 1].any():
+            assert not map.is_area_empty(x_min, y_min, x_max, y_max)
+
+
+def test_area_shortcut_matches_sampling(monkeypatch):
+    map = Map(open_level(64, 20))
+    line_of_sight = LineOfSight(map)
+    pairs = nearby_pairs(map, 600, max_offset=12)
+
+    shortcuts = []
+    is_area_empty = map.is_area_empty
+
+    def counted_is_area_empty(*area: int) -> bool:
+        empty = is_area_empty(*area)
+        shortcuts.append(empty)
+        return empty
+
+    monkeypatch.setattr(map, "is_area_empty", counted_is_area_empty)
+    expected = [sampled_los(map, from_xy, to_xy) for from_xy, to_xy in pairs]
+    single = [line_of_sight.has_los(from_xy, to_xy) for from_xy, to_xy in pairs]
+    batched = line_of_sight.has_los_many(
+        [from_xy for from_xy, _ in pairs], [to_xy for _, to_xy in pairs]
+    )
+
+    assert single == expected
+    assert batched.tolist() == expected
+    # The shortcut answered some of the queries and let others fall through to the grid walk
+    assert any(shortcuts) and not all(shortcuts)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from raycaster.core import Settings, Updatable
+from raycaster.game import Map
+from raycaster.rendering import Raycaster
+
+from conftest import open_level, random_poses
+
+
+class FakePlayer:
+    def __init__(self):
+        self.x = self.y = self.angle = 0.0
+
+
+def cast_frames(map: Map, poses: list[tuple[float, float, float]]) -> list[dict]:
+    player = FakePlayer()
+    raycaster = Raycaster(map, player)
+    frames = []
+    for player.x, player.y, player.angle in poses:
+        raycaster.update()
+        rays = raycaster.rays
+        frames.append({field: getattr(rays, field).copy() for field, _ in rays.FIELDS})
+    Updatable.unregister(raycaster)
+    return frames
+
+
+def assert_frames_match(
+    poses: list[tuple[float, float, float]],
+    expected_frames: list[dict],
+    frames: list[dict],
+):
+    # Lengths and hit points may differ in the last bit, from a different order of operations
+    for pose, expected, actual in zip(poses, expected_frames, frames):
+        for field, values in expected.items():
+            if values.dtype.kind == "f":
+                np.testing.assert_allclose(
+                    actual[field], values, rtol=1e-12, err_msg=f"{field} {pose}"
+                )
+            else:
+                np.testing.assert_array_equal(
+                    actual[field], values, err_msg=f"{field} {pose}"
+                )
+
+
+@pytest.mark.parametrize("empty_space_skipping", [False, True])
+@pytest.mark.parametrize("batch_raycasting", [False, True])
+@pytest.mark.parametrize("render_scale", [0.55, 1.0])
+def test_casting_matches_plain_scalar_casting(
+    configure, render_scale, batch_raycasting, empty_space_skipping
+):
+    configure(RAY_CACHE=False, RENDER_SCALE=render_scale)
+    map = Map()
+    poses = random_poses(map.level, 50)
+
+    configure(BATCH_RAYCASTING=False, EMPTY_SPACE_SKIPPING=False)
+    expected_frames = cast_frames(map, poses)
+    configure(
+        BATCH_RAYCASTING=batch_raycasting, EMPTY_SPACE_SKIPPING=empty_space_skipping
+    )
+    assert_frames_match(poses, expected_frames, cast_frames(map, poses))
+
+
+@pytest.mark.parametrize("empty_space_skipping", [False, True])
+@pytest.mark.parametrize("batch_raycasting", [False, True])
+def test_casting_matches_plain_scalar_casting_in_open_map(
+    configure, batch_raycasting, empty_space_skipping
+):
+    configure(RAY_CACHE=False, MAX_DISTANCE=40 * Settings.CELL_SIZE)
+    map = Map(open_level(64, 20))
+    poses = random_poses(map.level, 20)
+
+    configure(BATCH_RAYCASTING=False, EMPTY_SPACE_SKIPPING=False)
+    expected_frames = cast_frames(map, poses)
+    configure(
+        BATCH_RAYCASTING=batch_raycasting, EMPTY_SPACE_SKIPPING=empty_space_skipping
+    )
+    assert_frames_match(poses, expected_frames, cast_frames(map, poses))
@@ -0,0 +1,52 @@
+import math
+
+import pygame
+import pytest
+
+from raycaster.core import SimulationClock
+from raycaster.game.texture_atlas import TextureAtlas
+from raycaster.objects.animated_sprite_object import Animation
+from raycaster.rendering.sprite_projection_processor import SpriteProjectionProcessor
+
+
+class FakeRaycaster:
+    def __init__(self):
+        self.view_angle = 0.0
+
+
+class FakeSprite:
+    def __init__(self, texture):
+        self.texture = texture
+        self.distance = 300.0
+        self.angle = math.pi
+        self.in_fov = True
+
+
+@pytest.fixture
+def clock(game, monkeypatch):
+    monkeypatch.setattr(SpriteProjectionProcessor, "raycaster", FakeRaycaster())
+    clock = SimulationClock(frame_time=100)
+    clock.install()
+    yield clock
+    clock.uninstall()
+
+
+def test_projection_follows_animation_frame_with_fixed_pose(clock):
+    surfaces = []
+    for color in ("red", "green", "blue", "white"):
+        surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+        surface.fill(color)
+        surfaces.append(surface)
+    frames = TextureAtlas(1024).pack(surfaces)
+    animation = Animation(frames, duration=0.4)
+    sprite = FakeSprite(animation.current_frame)
+
+    seen = []
+    for _ in range(12):
+        clock.tick()
+        sprite.texture = animation.update_and_get_frame()
+        projection = SpriteProjectionProcessor.project(sprite)
+        assert projection.source_rect == sprite.texture.rect
+        seen.append(sprite.texture)
+
+    assert len(set(map(id, seen))) == len(frames)
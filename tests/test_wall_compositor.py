@@ -0,0 +1,55 @@
+import numpy as np
+import pygame
+import pytest
+
+from raycaster.core import Settings
+
+from conftest import random_poses
+
+MAGENTA = (255, 0, 255)
+
+
+def wall_hugging_poses(
+    level: list[list[int]], count: int
+) -> list[tuple[float, float, float]]:
+    """
+    Picks positions right in front of walls to the east, looking at them.
+    """
+    cell_size = Settings.CELL_SIZE
+    cells = [
+        (x, y)
+        for y, row in enumerate(level)
+        for x, cell in enumerate(row[:-1])
+        if not cell and row[x + 1]
+    ]
+    return [((x + 1) * cell_size - 1, (y + 0.5) * cell_size, 0) for x, y in cells][
+        :count
+    ]
+
+
+def draw_walls(renderer, compositor: bool) -> np.ndarray:
+    rays = renderer.raycaster.rays
+    renderer.frame.fill(MAGENTA)
+    if compositor:
+        renderer.wall_compositor.draw(rays)
+    else:
+        walls = np.flatnonzero(rays.hit_wall)
+        walls = walls[np.argsort(-rays.length[walls], kind="stable")]
+        for index in walls.tolist():
+            renderer._draw_wall(rays[index])
+    return pygame.surfarray.array2d(renderer.frame)
+
+
+@pytest.mark.parametrize("render_scale", [0.5, 0.55, 0.73, 1.0])
+def test_compositor_matches_blitted_walls(game, configure, render_scale):
+    configure(RENDER_SCALE=render_scale)
+    renderer = game.renderer
+    renderer._update_frame()
+    poses = random_poses(game.map.level, 20) + wall_hugging_poses(game.map.level, 5)
+    for x, y, angle in poses:
+        game.player.x, game.player.y, game.player.angle = x, y, angle
+        game.raycaster.update()
+
+        blitted = draw_walls(renderer, compositor=False)
+        composited = draw_walls(renderer, compositor=True)
+        assert np.array_equal(blitted, composited), (x, y, angle)